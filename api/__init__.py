@@ -3,13 +3,109 @@ Auto-Trader API
 Flask application initialization and configuration.
 """
 
-from flask import Flask
+import sqlite3
+import hashlib
+import functools
+import orjson
+from flask import Flask, current_app, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from core.logging_config import get_logger
 
 # Configure logging
 logger = get_logger('autotrader.api', 'api')
 
+# orjson options used for every API response
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+def _orjson_default(obj):
+    """
+    Serialize types orjson doesn't handle natively
+    """
+    if isinstance(obj, sqlite3.Row):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def ojsonify(obj, status=200):
+    """
+    Drop-in replacement for flask.jsonify backed by orjson.
+    
+    Args:
+        obj: JSON-serializable object (dicts, lists, datetimes, numpy values, sqlite3.Row)
+        status (int, optional): HTTP status code. Defaults to 200.
+        
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    return current_app.response_class(
+        orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+
+def ojsonify_stream(key, items, status=200):
+    """
+    Stream {key: [items...]} as JSON, serializing one item at a time.
+    
+    Args:
+        key (str): Name of the top-level list field
+        items (iterable): Items to serialize (e.g. a generator of sqlite3.Row)
+        status (int, optional): HTTP status code. Defaults to 200.
+        
+    Returns:
+        Response: Streaming Flask response with an application/json body
+    """
+    def generate():
+        yield b'{' + orjson.dumps(key) + b':['
+        prefix = b''
+        for item in items:
+            yield prefix + orjson.dumps(item, default=_orjson_default, option=ORJSON_OPTIONS)
+            prefix = b','
+        yield b']}'
+        
+    return current_app.response_class(generate(), status=status, mimetype='application/json')
+
+def etagged(max_age=None):
+    """
+    Decorator adding an ETag to successful GET responses and answering
+    304 Not Modified when the client's If-None-Match matches.
+    
+    Args:
+        max_age (int, optional): Cache-Control max-age in seconds. If None,
+            clients must revalidate on every request (no-cache).
+            
+    Returns:
+        function: Decorator for a view function
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+                
+            # The hash needs the full payload, so don't use this on streamed views
+            body = response.get_data()
+            response.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest(), weak=True)
+            if max_age is None:
+                response.cache_control.no_cache = True
+            else:
+                response.cache_control.max_age = max_age
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider that uses orjson for parsing request bodies
+    (request.json / request.get_json) and for app.json.dumps.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS).decode()
+        
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app(config=None):
     """
     Create and configure the Flask application.
@@ -24,6 +120,7 @@ def create_app(config=None):
     app = Flask(__name__, 
                 static_folder='../frontend/static',
                 template_folder='../frontend/templates')
+    app.json = OrjsonProvider(app)
     
     # Enable CORS
     CORS(app)
@@ -40,6 +137,9 @@ def create_app(config=None):
         app.config.update(config)
         logger.debug("Applied custom configuration")
     
+    # Orders database, attached by the application entry point (see app.py)
+    app.db = app.config.get('database')
+    
     # Register blueprints
     from api.routes import portfolio, options, recommendations
     app.register_blueprint(portfolio.bp)
@@ -2,13 +2,17 @@
 Options API routes
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app
+from api import ojsonify, ojsonify_stream, etagged
 from api.services.options_service import OptionsService
-import traceback
 import logging
 import time
 import json
 import datetime
+import functools
+import re
+import threading
+from cachetools import TTLCache
 
 # Set up logger
 logger = logging.getLogger('api.routes.options')
@@ -16,6 +20,54 @@ logger = logging.getLogger('api.routes.options')
 bp = Blueprint('options', __name__, url_prefix='/api/options')
 options_service = OptionsService()
 
+# Option expirations only change when chains roll, so cache them per ticker for an hour
+_expirations_cache = TTLCache(maxsize=512, ttl=3600)
+_expirations_lock = threading.RLock()
+
+# Supported option types for filtering
+_VALID_OPTION_TYPES = frozenset({'CALL', 'PUT'})
+
+# Separator for ticker lists (commas and/or any whitespace)
+_TICKER_SPLIT = re.compile(r'[\s,]+')
+
+# Required request fields for order creation endpoints
+_SAVE_ORDER_REQUIRED = frozenset({'ticker', 'option_type', 'strike', 'expiration'})
+_ROLLOVER_REQUIRED = frozenset({'ticker', 'current_option_type', 'current_strike', 'current_expiration',
+                                'new_strike', 'new_expiration', 'quantity'})
+
+def _parse_otm(value, default=10.0):
+    """
+    Parse the OTM percentage query parameter
+    
+    Args:
+        value (str): Raw query parameter value
+        default (float, optional): Value to use when the parameter is absent
+        
+    Returns:
+        float: OTM percentage in [0, 100], or None if invalid
+    """
+    try:
+        otm = float(value) if value else default
+    except ValueError:
+        return None
+    return otm if 0 <= otm <= 100 else None
+
+@functools.lru_cache(maxsize=64)
+def _parse_expiration(value):
+    """
+    Parse an expiration date in YYYYMMDD format (cached, clients repeat the same dates)
+    
+    Args:
+        value (str): Expiration date string
+        
+    Returns:
+        datetime.date: Parsed date, or None if invalid
+    """
+    try:
+        return datetime.datetime.strptime(value, '%Y%m%d').date()
+    except ValueError:
+        return None
+
 # Market status is now checked directly in the route functions
 
 # Helper function to check market status with better error handling
@@ -26,13 +78,21 @@ def otm_options():
     """
     # Get parameters from request
     ticker = request.args.get('tickers')
-    otm_percentage = float(request.args.get('otm', 10))
+    otm_percentage = _parse_otm(request.args.get('otm'))
     option_type = request.args.get('optionType')  # Parameter for filtering by option type
     expiration = request.args.get('expiration')   # New parameter for filtering by expiration date
     
+    # Validate otm percentage
+    if otm_percentage is None:
+        return ojsonify({"error": f"Invalid otm: {request.args.get('otm')}. Must be a number between 0 and 100"}), 400
+    
+    # Validate expiration if provided
+    if expiration and _parse_expiration(expiration) is None:
+        return ojsonify({"error": f"Invalid expiration: {expiration}. Must be in YYYYMMDD format"}), 400
+    
     # Validate option_type if provided
-    if option_type and option_type not in ['CALL', 'PUT']:
-        return jsonify({"error": f"Invalid option_type: {option_type}. Must be 'CALL' or 'PUT'"}), 400
+    if option_type and option_type not in _VALID_OPTION_TYPES:
+        return ojsonify({"error": f"Invalid option_type: {option_type}. Must be 'CALL' or 'PUT'"}), 400
     
     # Use the existing module-level instance instead of creating a new one
     # Call the service with appropriate parameters including the new option_type and expiration
@@ -43,9 +103,10 @@ def otm_options():
         expiration=expiration
     )
     
-    return jsonify(result)
+    return ojsonify(result)
 
 @bp.route('/stock-price', methods=['GET'])
+@etagged(max_age=5)
 def get_stock_price():
     """
     Get the current stock price for one or more tickers.
@@ -54,28 +115,23 @@ def get_stock_price():
     # Get ticker(s) from request
     tickers_param = request.args.get('tickers', '')
     if not tickers_param:
-        return jsonify({"error": "No tickers provided"}), 400
+        return ojsonify({"error": "No tickers provided"}), 400
     
-    # Split tickers on commas if multiple are provided
-    tickers = [t.strip() for t in tickers_param.split(',')]
+    # Split tickers on commas/whitespace if multiple are provided, dropping duplicates
+    tickers = list(dict.fromkeys(t for t in _TICKER_SPLIT.split(tickers_param) if t))
     
     # Get stock prices for the tickers
-    prices = {}
     try:
-        for ticker in tickers:
-            if ticker:
-                # Use the options service to get the stock price without option data
-                price = options_service.get_stock_price(ticker)
-                prices[ticker] = price
+        # Use the options service to fetch all stock prices concurrently without option data
+        prices = options_service.get_stock_prices(tickers)
         
-        return jsonify({
+        return ojsonify({
             "status": "success",
             "data": prices
         })
     except Exception as e:
-        logger.error(f"Error getting stock price for {tickers_param}: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e), "status": "error"}), 500
+        logger.exception("Error getting stock price for %s: %s", tickers_param, e)
+        return ojsonify({"error": str(e), "status": "error"}), 500
 
 @bp.route('/order', methods=['POST'])
 def save_order():
@@ -86,25 +142,23 @@ def save_order():
         # Get order data from request
         order_data = request.json
         if not order_data:
-            return jsonify({"error": "No order data provided"}), 400
+            return ojsonify({"error": "No order data provided"}), 400
             
         # Validate required fields
-        required_fields = ['ticker', 'option_type', 'strike', 'expiration']
-        for field in required_fields:
-            if field not in order_data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
+        missing = _SAVE_ORDER_REQUIRED - order_data.keys()
+        if missing:
+            return ojsonify({"error": f"Missing required fields: {', '.join(sorted(missing))}"}), 400
         
         # Save order to database
         order_id = options_service.db.save_order(order_data)
         
         if order_id:
-            return jsonify({"success": True, "order_id": order_id}), 201
+            return ojsonify({"success": True, "order_id": order_id}), 201
         else:
-            return jsonify({"error": "Failed to save order"}), 500
+            return ojsonify({"error": "Failed to save order"}), 500
     except Exception as e:
-        logger.error(f"Error saving order: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error saving order: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/pending-orders', methods=['GET'])
 def get_pending_orders():
@@ -125,14 +179,16 @@ def get_pending_orders():
         if is_rollover_param is not None:
             is_rollover = is_rollover_param.lower() == 'true'
         
-        # Get pending orders from database
-        orders = options_service.db.get_pending_orders(executed=executed, isRollover=is_rollover)
+        if executed:
+            orders = options_service.db.get_pending_orders(executed=executed, isRollover=is_rollover)
+            return ojsonify({"orders": orders})
         
-        return jsonify({"orders": orders})
+        # Run the query here so DB errors are reported below; only the rows are streamed
+        orders = options_service.db.select_pending_orders(isRollover=is_rollover)
+        return ojsonify_stream("orders", orders)
     except Exception as e:
-        logger.error(f"Error getting pending orders: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error getting pending orders: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/order/<int:order_id>', methods=['DELETE'])
 def delete_order(order_id):
@@ -145,35 +201,34 @@ def delete_order(order_id):
     Returns:
         JSON response with success status
     """
-    logger.info(f"DELETE /order/{order_id} request received")
+    logger.info("DELETE /order/%s request received", order_id)
     
     try:
         # Get the database instance
-        db = current_app.config.get('database')
+        db = current_app.db
         if not db:
             logger.error("Database not initialized")
-            return jsonify({"error": "Database not initialized"}), 500
+            return ojsonify({"error": "Database not initialized"}), 500
             
         # Try to get the order first to ensure it exists
-        order = db.get_order(order_id)
+        order = db.get_order(order_id, columns=('id',))
         if not order:
-            logger.error(f"Order with ID {order_id} not found")
-            return jsonify({"error": f"Order with ID {order_id} not found"}), 404
+            logger.error("Order with ID %s not found", order_id)
+            return ojsonify({"error": f"Order with ID {order_id} not found"}), 404
             
         # Delete the order
         success = db.delete_order(order_id)
         
         if success:
-            logger.info(f"Order with ID {order_id} successfully deleted")
-            return jsonify({"success": True, "message": f"Order with ID {order_id} deleted"}), 200
+            logger.info("Order with ID %s successfully deleted", order_id)
+            return ojsonify({"success": True, "message": f"Order with ID {order_id} deleted"}), 200
         else:
-            logger.error(f"Failed to delete order with ID {order_id}")
-            return jsonify({"error": "Failed to delete order"}), 500
+            logger.error("Failed to delete order with ID %s", order_id)
+            return ojsonify({"error": "Failed to delete order"}), 500
             
     except Exception as e:
-        logger.error(f"Error deleting order: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error deleting order: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/execute/<int:order_id>', methods=['POST'])
 def execute_order(order_id):
@@ -186,25 +241,24 @@ def execute_order(order_id):
     Returns:
         JSON response with execution details
     """
-    logger.info(f"POST /execute/{order_id} request received")
+    logger.info("POST /execute/%s request received", order_id)
     
     try:
         # Get the database instance
-        db = current_app.config.get('database')
+        db = current_app.db
         if not db:
             logger.error("Database not initialized")
-            return jsonify({"error": "Database not initialized"}), 500
+            return ojsonify({"error": "Database not initialized"}), 500
             
         # Use the options service to execute the order
         response, status_code = options_service.execute_order(order_id, db)
         
         # Return the response from the service
-        return jsonify(response), status_code
+        return ojsonify(response), status_code
             
     except Exception as e:
-        logger.error(f"Error executing order: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error executing order: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/check-orders', methods=['POST'])
 def check_orders():
@@ -221,12 +275,11 @@ def check_orders():
         response = options_service.check_pending_orders()
         
         # Return the response from the service
-        return jsonify(response), 200
+        return ojsonify(response), 200
             
     except Exception as e:
-        logger.error(f"Error checking orders: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error checking orders: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/rollover', methods=['POST'])
 def rollover_option():
@@ -246,63 +299,65 @@ def rollover_option():
         # Get order data from request
         rollover_data = request.json
         if not rollover_data:
-            return jsonify({"error": "No rollover data provided"}), 400
+            return ojsonify({"error": "No rollover data provided"}), 400
             
-        # Validate required fields for current option
-        required_fields = ['ticker', 'current_option_type', 'current_strike', 'current_expiration', 
-                           'new_strike', 'new_expiration', 'quantity']
-        for field in required_fields:
-            if field not in rollover_data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
+        # Validate required fields for current and new option
+        missing = _ROLLOVER_REQUIRED - rollover_data.keys()
+        if missing:
+            return ojsonify({"error": f"Missing required fields: {', '.join(sorted(missing))}"}), 400
+        
+        # Fields shared by both legs of the rollover
+        rd_get = rollover_data.get
+        ticker, option_type, quantity = (rollover_data['ticker'], rollover_data['current_option_type'],
+                                         rollover_data['quantity'])
         
         # Create buy order to close current position
         buy_order = {
-            'ticker': rollover_data['ticker'],
-            'option_type': rollover_data['current_option_type'],
+            'ticker': ticker,
+            'option_type': option_type,
             'strike': rollover_data['current_strike'],
             'expiration': rollover_data['current_expiration'],
             'action': 'BUY',  # Buy to close
-            'quantity': rollover_data['quantity'],
-            'order_type': rollover_data.get('current_order_type', 'MARKET'),
-            'limit_price': rollover_data.get('current_limit_price'),  # Already per-contract from frontend
-            'bid': rollover_data.get('current_bid', 0),
-            'ask': rollover_data.get('current_ask', 0),
+            'quantity': quantity,
+            'order_type': rd_get('current_order_type', 'MARKET'),
+            'limit_price': rd_get('current_limit_price'),  # Already per-contract from frontend
+            'bid': rd_get('current_bid', 0),
+            'ask': rd_get('current_ask', 0),
             'isRollover': True
         }
         
         # Create sell order for new position
         sell_order = {
-            'ticker': rollover_data['ticker'],
-            'option_type': rollover_data['current_option_type'],  # Same option type
+            'ticker': ticker,
+            'option_type': option_type,  # Same option type
             'strike': rollover_data['new_strike'],
             'expiration': rollover_data['new_expiration'],
             'action': 'SELL',  # Sell to open
-            'quantity': rollover_data['quantity'],
-            'order_type': rollover_data.get('new_order_type', 'LIMIT'),
-            'limit_price': rollover_data.get('new_limit_price', 0) * 100,  # Convert from per-share to per-contract
-            'bid': rollover_data.get('new_bid', 0),
-            'ask': rollover_data.get('new_ask', 0),
+            'quantity': quantity,
+            'order_type': rd_get('new_order_type', 'LIMIT'),
+            'limit_price': rd_get('new_limit_price', 0) * 100,  # Convert from per-share to per-contract
+            'bid': rd_get('new_bid', 0),
+            'ask': rd_get('new_ask', 0),
             'isRollover': True
         }
         
-        # Save orders to database
-        buy_order_id = options_service.db.save_order(buy_order)
-        sell_order_id = options_service.db.save_order(sell_order)
+        # Save both orders to database in a single transaction
+        order_ids = options_service.db.save_orders([buy_order, sell_order])
         
-        if buy_order_id and sell_order_id:
-            return jsonify({
+        if order_ids:
+            buy_order_id, sell_order_id = order_ids
+            return ojsonify({
                 "success": True, 
                 "buy_order_id": buy_order_id,
                 "sell_order_id": sell_order_id,
                 "message": "Rollover orders created successfully"
             }), 201
         else:
-            return jsonify({"error": "Failed to create one or more rollover orders"}), 500
+            return ojsonify({"error": "Failed to create one or more rollover orders"}), 500
             
     except Exception as e:
-        logger.error(f"Error creating rollover orders: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error creating rollover orders: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/cancel/<int:order_id>', methods=['POST'])
 def cancel_order(order_id):
@@ -315,19 +370,18 @@ def cancel_order(order_id):
     Returns:
         JSON response with cancellation details
     """
-    logger.info(f"POST /cancel/{order_id} request received")
+    logger.info("POST /cancel/%s request received", order_id)
     
     try:
         # Use the options service to cancel the order
         response, status_code = options_service.cancel_order(order_id)
         
         # Return the response from the service
-        return jsonify(response), status_code
+        return ojsonify(response), status_code
             
     except Exception as e:
-        logger.error(f"Error canceling order: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error canceling order: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/order/<int:order_id>/quantity', methods=['PUT'])
 def update_order_quantity(order_id):
@@ -340,61 +394,61 @@ def update_order_quantity(order_id):
     Returns:
         JSON response with success status
     """
-    logger.info(f"PUT /order/{order_id}/quantity request received")
+    logger.info("PUT /order/%s/quantity request received", order_id)
     
     try:
         # Get request data
         request_data = request.json
         if not request_data or 'quantity' not in request_data:
             logger.error("Missing quantity in request")
-            return jsonify({"error": "Missing quantity in request"}), 400
+            return ojsonify({"error": "Missing quantity in request"}), 400
             
         quantity = int(request_data['quantity'])
         if quantity <= 0:
-            logger.error(f"Invalid quantity: {quantity}")
-            return jsonify({"error": "Quantity must be greater than 0"}), 400
+            logger.error("Invalid quantity: %s", quantity)
+            return ojsonify({"error": "Quantity must be greater than 0"}), 400
             
         # Get the database instance
-        db = current_app.config.get('database')
+        db = current_app.db
         if not db:
             logger.error("Database not initialized")
-            return jsonify({"error": "Database not initialized"}), 500
+            return ojsonify({"error": "Database not initialized"}), 500
             
         # Try to get the order first to ensure it exists
-        order = db.get_order(order_id)
+        order = db.get_order(order_id, columns=('id', 'status'))
         if not order:
-            logger.error(f"Order with ID {order_id} not found")
-            return jsonify({"error": f"Order with ID {order_id} not found"}), 404
+            logger.error("Order with ID %s not found", order_id)
+            return ojsonify({"error": f"Order with ID {order_id} not found"}), 404
             
         # Check if order is in editable state
         if order['status'] != 'pending':
-            logger.error(f"Cannot update quantity for order with status '{order['status']}'")
-            return jsonify({"error": f"Cannot update quantity for non-pending orders"}), 400
+            logger.error("Cannot update quantity for order with status '%s'", order['status'])
+            return ojsonify({"error": f"Cannot update quantity for non-pending orders"}), 400
             
         # Update the order quantity
         success = db.update_order_quantity(order_id, quantity)
         
         if success:
-            logger.info(f"Order with ID {order_id} quantity updated to {quantity}")
-            return jsonify({
+            logger.info("Order with ID %s quantity updated to %s", order_id, quantity)
+            return ojsonify({
                 "success": True, 
                 "message": f"Order quantity updated to {quantity}",
                 "order_id": order_id,
                 "quantity": quantity
             }), 200
         else:
-            logger.error(f"Failed to update quantity for order with ID {order_id}")
-            return jsonify({"error": "Failed to update order quantity"}), 500
+            logger.error("Failed to update quantity for order with ID %s", order_id)
+            return ojsonify({"error": "Failed to update order quantity"}), 500
             
     except ValueError as ve:
-        logger.error(f"Invalid quantity value: {str(ve)}")
-        return jsonify({"error": "Invalid quantity value"}), 400
+        logger.error("Invalid quantity value: %s", ve)
+        return ojsonify({"error": "Invalid quantity value"}), 400
     except Exception as e:
-        logger.error(f"Error updating order quantity: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error updating order quantity: %s", e)
+        return ojsonify({"error": str(e)}), 500
 
 @bp.route('/expirations', methods=['GET'])
+@etagged(max_age=600)
 def get_option_expirations():
     """
     Get available expiration dates for options of a given ticker.
@@ -411,7 +465,14 @@ def get_option_expirations():
         # Get ticker from request
         ticker = request.args.get('ticker')
         if not ticker:
-            return jsonify({"error": "No ticker provided"}), 400
+            return ojsonify({"error": "No ticker provided"}), 400
+            
+        # Serve from cache if we've looked this ticker up recently
+        cache_key = ticker.upper()
+        with _expirations_lock:
+            result = _expirations_cache.get(cache_key)
+        if result is not None:
+            return ojsonify(result)
             
         # Call the service method to get option expirations
         result = options_service.get_option_expirations(ticker)
@@ -419,15 +480,16 @@ def get_option_expirations():
         # Check if there was an error
         if "error" in result:
             error_message = result["error"]
-            logger.error(f"Error getting expirations for {ticker}: {error_message}")
-            return jsonify({"error": error_message}), 404
+            logger.error("Error getting expirations for %s: %s", ticker, error_message)
+            return ojsonify({"error": error_message}), 404
             
-        # Return successful response
-        return jsonify(result)
+        # Cache and return successful response
+        with _expirations_lock:
+            _expirations_cache[cache_key] = result
+        return ojsonify(result)
             
     except Exception as e:
-        logger.error(f"Error getting option expirations for {request.args.get('ticker', 'unknown')}: {str(e)}")
-        logger.error(traceback.format_exc())
-        return jsonify({"error": str(e)}), 500
+        logger.exception("Error getting option expirations for %s: %s", request.args.get('ticker', 'unknown'), e)
+        return ojsonify({"error": str(e)}), 500
        
 
@@ -2,12 +2,16 @@
 Portfolio API routes
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
+from api import ojsonify
 from api.services.portfolio_service import PortfolioService
 
 bp = Blueprint('portfolio', __name__, url_prefix='/api/portfolio')
 portfolio_service = PortfolioService()
 
+# Supported position types for filtering
+_VALID_POSITION_TYPES = frozenset({'STK', 'OPT'})
+
 @bp.route('/', methods=['GET'])
 def get_portfolio():
     """
@@ -15,9 +19,9 @@ def get_portfolio():
     """
     try:
         results = portfolio_service.get_portfolio_summary()
-        return jsonify(results)
+        return ojsonify(results)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @bp.route('/positions', methods=['GET'])
 def get_positions():
@@ -31,19 +35,22 @@ def get_positions():
         # Get the position_type from query parameters
         position_type = request.args.get('type')
         # Validate position_type
-        if position_type and position_type not in ['STK', 'OPT']:
-            return jsonify({'error': 'Invalid position type. Supported types: STK, OPT'}), 400
+        if position_type and position_type not in _VALID_POSITION_TYPES:
+            return ojsonify({'error': 'Invalid position type. Supported types: STK, OPT'}), 400
             
         results = portfolio_service.get_positions(position_type)
-        return jsonify(results)
+        return ojsonify(results)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @bp.route('/weekly-income', methods=['GET'])
 def get_weekly_income():
     """
     Get weekly option income from short options expiring this Friday.
     
+    Query Parameters:
+        totals_only: If true, omit the per-position list and return only the aggregates.
+    
     Returns:
         A JSON response containing weekly option income data:
         {
@@ -74,19 +81,22 @@ def get_weekly_income():
         }
     """
     try:
-        results = portfolio_service.get_weekly_option_income()
+        if request.args.get('totals_only', '').lower() in ('1', 'true'):
+            results = portfolio_service.get_weekly_option_totals()
+        else:
+            results = portfolio_service.get_weekly_option_income()
         
         if 'error' in results:
-            return jsonify({
+            return ojsonify({
                 'error': results['error'],
                 'positions': [],
                 'total_income': 0,
                 'positions_count': 0
             }), 500
         
-        return jsonify(results), 200
+        return ojsonify(results), 200
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'error': str(e),
             'positions': [],
             'total_income': 0,
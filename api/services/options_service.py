@@ -4,19 +4,14 @@ Handles options data retrieval and processing
 """
 
 import logging
-import math
 import random
 import time
-from datetime import datetime, timedelta, time as datetime_time
-import pandas as pd
+from datetime import datetime, timedelta
 # from core.connection import IBConnection, Option, Stock, suppress_ib_logs  # <-- COMMENTED OUT
-from core.utils import get_closest_friday, get_next_monthly_expiration, is_market_hours
 from config import Config
-from db.database import OptionsDatabase
+from db.database import get_database
 import traceback
 import concurrent.futures
-from functools import partial
-import json
 
 logger = logging.getLogger('api.services.options')
 
@@ -27,10 +22,23 @@ class OptionsService:
     def __init__(self):
         self.config = Config()
         self.connection = None
-        db_path = self.config.get('db_path')
-        self.db = OptionsDatabase(db_path)
+        self.db_path = self.config.get('db_path')
+        # Opened on first use (see the db property) so importing the routes stays cheap
+        self._db = None
         self.portfolio_service = None  # Will be initialized when needed
         
+    @property
+    def db(self):
+        """
+        Shared options database, opened on first access
+        
+        Returns:
+            OptionsDatabase: The process-wide handle for db_path (also used as app.db)
+        """
+        if self._db is None:
+            self._db = get_database(self.db_path)
+        return self._db
+        
     def _ensure_connection(self):
         """
         Ensure that the IB connection exists and is connected.
@@ -233,6 +241,25 @@ class OptionsService:
         # --- FIX: Added pass to make function valid ---
         return 0 
 
+    def get_stock_prices(self, tickers):
+        """
+        Get the current stock prices for several tickers.
+        Lookups are I/O-bound, so they are issued concurrently.
+        
+        Args:
+            tickers (list): List of ticker symbols
+            
+        Returns:
+            dict: Mapping of ticker to current stock price
+        """
+        tickers = [ticker for ticker in tickers if ticker]
+        if not tickers:
+            return {}
+            
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+            prices = executor.map(self.get_stock_price, tickers)
+            return dict(zip(tickers, prices))
+
     def get_option_expirations(self, ticker):
         """
         Get available expiration dates for options of a given ticker.
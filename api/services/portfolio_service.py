@@ -3,15 +3,121 @@ Portfolio Service module (api/services/portfolio_service.py)
 Manages portfolio data and calculations using SnapTrade
 """
 
+import atexit
 import logging
-import time
-import traceback
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+import numpy as np
+import pandas as pd
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 from core.connection import SnapTradeConnection
 from config import Config
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
 logger = logging.getLogger('api.services.portfolio')
 
+# Flattened SnapTrade fields used to build positions
+_POSITION_NUMERIC_FIELDS = ['units', 'price', 'average_purchase_price', 'open_pnl']
+_STOCK_FIELDS = ['symbol.symbol.symbol', 'symbol.symbol.type.description'] + _POSITION_NUMERIC_FIELDS
+_OPTION_FIELDS = [
+    'symbol.option_symbol.underlying_symbol.symbol',
+    'symbol.option_symbol.expiration_date',
+    'symbol.option_symbol.strike_price',
+    'symbol.option_symbol.option_type',
+] + _POSITION_NUMERIC_FIELDS
+
+# Option position fields used by the weekly income calculation and its output columns
+_WEEKLY_SOURCE_FIELDS = ['symbol', 'option_type', 'strike', 'expiration', 'expiration_int', 'position', 'avg_cost']
+_WEEKLY_FIELDS = ['symbol', 'option_type', 'strike', 'expiration', 'position',
+                  'premium_per_contract', 'avg_cost', 'income', 'commission', 'notional_value']
+
+@dataclass(slots=True)
+class Position:
+    """
+    A stock or option holding. Option-only fields keep their defaults for stocks.
+    """
+    symbol: str
+    position: float
+    market_price: float
+    market_value: float
+    avg_cost: float
+    unrealized_pnl: float
+    security_type: str
+    expiration: str = ''
+    expiration_int: int = 0
+    strike: float = 0.0
+    option_type: str = ''
+
+    def to_dict(self):
+        """
+        Get the API representation. Option-only fields are included for
+        options only; internal fields such as expiration_int are left out.
+
+        Returns:
+            dict: Position fields for the /positions response
+        """
+        keys, values = _OPTION_VIEW if self.security_type == 'OPT' else _STOCK_VIEW
+        return dict(zip(keys, values(self)))
+
+# Public fields per security type, with a getter returning their values in order
+_STOCK_KEYS = ('symbol', 'position', 'market_price', 'market_value', 'avg_cost',
+               'unrealized_pnl', 'security_type')
+_OPTION_KEYS = _STOCK_KEYS + ('expiration', 'strike', 'option_type')
+_STOCK_VIEW = (_STOCK_KEYS, attrgetter(*_STOCK_KEYS))
+_OPTION_VIEW = (_OPTION_KEYS, attrgetter(*_OPTION_KEYS))
+
+_weekly_source_values = attrgetter(*_WEEKLY_SOURCE_FIELDS)
+
+@lru_cache(maxsize=1)
+def _this_friday_for(today_ord):
+    """
+    Get the Friday of the week for a given day (the day itself if it is a Friday)
+    
+    Args:
+        today_ord (int): Proleptic Gregorian ordinal of the day, e.g. date.today().toordinal()
+        
+    Returns:
+        tuple: (friday as YYYYMMDD int, friday as YYYY-MM-DD string)
+    """
+    today = date.fromordinal(today_ord)
+    this_friday = today + timedelta(days=(4 - today.weekday()) % 7)
+    return int(this_friday.strftime('%Y%m%d')), this_friday.isoformat()
+
+def _normalize_positions(records, fields, symbol_field):
+    """
+    Flatten nested SnapTrade position records into a DataFrame
+    
+    Args:
+        records (list): Position dictionaries from SnapTrade
+        fields (list): Dotted field paths to keep (missing ones are added as NaN)
+        symbol_field (str): Field that must be present for a row to be kept
+        
+    Returns:
+        pd.DataFrame: One row per usable position, numeric fields defaulted to 0
+    """
+    df = pd.json_normalize(records).reindex(columns=fields)
+    df = df.dropna(subset=[symbol_field])
+    df[_POSITION_NUMERIC_FIELDS] = df[_POSITION_NUMERIC_FIELDS].apply(pd.to_numeric, errors='coerce').fillna(0)
+    return df
+
+def _position_columns(df, symbol_field, security_type):
+    """
+    Build the columns shared by stock and option positions
+    """
+    return pd.DataFrame({
+        'symbol': df[symbol_field],
+        'position': df['units'],
+        'market_price': df['price'],
+        'market_value': df['units'] * df['price'],
+        'avg_cost': df['average_purchase_price'],
+        'unrealized_pnl': df['open_pnl'],
+        'security_type': security_type,
+    })
+
 class PortfolioService:
     """
     Service for handling portfolio operations via SnapTrade
@@ -20,20 +126,40 @@ class PortfolioService:
         self.config = Config()
         self.logger = logger
         self.logger.info(f"Portfolio service initializing with SnapTrade")
-        self.connection = SnapTradeConnection()
+        # One SnapTrade connection per worker thread so concurrent requests don't share a client
+        self._tls = threading.local()
         self.primary_account_id = None
         
         # Cache to prevent hitting the API on every single dashboard call
-        self.holdings_cache = None
-        self.cache_time = None
         self.CACHE_DURATION = 60  # Cache for 60 seconds
+        self._holdings_cache = TTLCache(maxsize=4, ttl=self.CACHE_DURATION)
+        self._holdings_lock = threading.Lock()
+        # Holdings fetches in progress, keyed like the cache, so concurrent misses share one request
+        self._holdings_pending = {}
+        # Results derived from a holdings snapshot, keyed by (name, id(holdings))
+        self._derived_cache = {}
+        
+        # Background worker for warming the holdings cache off the request thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='portfolio-prefetch')
+        atexit.register(self._executor.shutdown, wait=False)
+        
+    @property
+    def connection(self):
+        """
+        Get the SnapTrade connection for the current thread, creating it on first use
+        """
+        connection = getattr(self._tls, 'connection', None)
+        if connection is None:
+            connection = SnapTradeConnection()
+            self._tls.connection = connection
+        return connection
         
     def _ensure_connection(self):
         """
         Ensure that the SnapTrade connection exists and is connected
         """
         try:
-            if self.connection is None or not self.connection.is_connected():
+            if not self.connection.is_connected():
                 self.logger.info("Connecting to SnapTrade...")
                 if not self.connection.connect():
                     self.logger.error("Failed to connect to SnapTrade")
@@ -64,8 +190,7 @@ class PortfolioService:
                 self.logger.error("No SnapTrade accounts found for this user.")
                 return None
         except Exception as e:
-            self.logger.error(f"Error getting SnapTrade primary account ID: {e}")
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Error getting SnapTrade primary account ID: {e}")
             return None
 
     def _get_holdings_cache(self):
@@ -73,36 +198,71 @@ class PortfolioService:
         Helper to get cached account holdings (which includes balances,
         positions, and option_positions) to reduce API calls.
         """
-        current_time = time.time()
-        # Check cache
-        if self.holdings_cache and self.cache_time and \
-           (current_time - self.cache_time) < self.CACHE_DURATION:
-            self.logger.debug("Returning cached account holdings")
-            return self.holdings_cache
-
         # Get account ID
         account_id = self._get_primary_account_id()
         if not account_id:
             return None
 
+        # Check cache, then any fetch already in flight
+        key = hashkey(account_id)
+        with self._holdings_lock:
+            holdings = self._holdings_cache.get(key)
+            pending = None if holdings else self._holdings_pending.get(key)
+            if not holdings and pending is None:
+                pending = self._holdings_pending[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if holdings:
+            self.logger.debug("Returning cached account holdings")
+            return holdings
+        if not owner:
+            self.logger.debug("Waiting for in-flight account holdings fetch")
+            return pending.result()
+
         # Fetch new data
         self.logger.debug("Fetching fresh account holdings from SnapTrade")
-        # This one method gets balances, positions, and option_positions
-        holdings = self.connection.get_user_holdings(account_id)
+        holdings = None
+        try:
+            # This one method gets balances, positions, and option_positions
+            holdings = self.connection.get_user_holdings(account_id)
+        finally:
+            with self._holdings_lock:
+                if holdings:
+                    self._holdings_cache[key] = holdings
+                    # New snapshot, so anything derived from the old one is stale
+                    self._derived_cache.clear()
+                del self._holdings_pending[key]
+            # Waiters get the same snapshot, or None if the fetch failed
+            pending.set_result(holdings)
         
         if holdings:
-            self.holdings_cache = holdings
-            self.cache_time = current_time
             return holdings
         else:
             self.logger.error("Failed to fetch holdings from SnapTrade")
             return None
 
-    def _get_balances(self):
+    def prefetch(self):
+        """
+        Start fetching account holdings in the background so the portfolio
+        API calls made by a page on load find the cache already populated.
+        Requests arriving while the fetch is running wait on it rather than
+        calling SnapTrade again.
+        
+        Returns:
+            Future: The pending holdings fetch
+        """
+        return self._executor.submit(self._get_holdings_cache)
+
+    def _get_balances(self, holdings=None):
         """
         Gets balances from the cached holdings.
+        
+        Args:
+            holdings (dict, optional): Holdings snapshot to read. Defaults to the cached one.
         """
-        holdings = self._get_holdings_cache()
+        if holdings is None:
+            holdings = self._get_holdings_cache()
         # Check if holdings (a dict) exists and has the 'balances' key
         if holdings and 'balances' in holdings:
             return holdings['balances']
@@ -110,13 +270,21 @@ class PortfolioService:
 
     def _get_positions(self):
         """
-        Gets BOTH stock and option positions from the cached holdings
-        and returns them as a single combined list.
+        Gets BOTH stock and option positions from the cached holdings,
+        partitioned by security type.
+        
+        Returns:
+            dict: Position lists keyed by security type ('STK', 'OPT', ...),
+                  plus 'ALL' for the combined list
         """
         holdings = self._get_holdings_cache()
         if not holdings:
             self.logger.warning("No holdings data available to get positions.")
-            return []
+            return {'STK': [], 'OPT': [], 'ALL': []}
+        
+        cache_key = ('positions', id(holdings))
+        if cache_key in self._derived_cache:
+            return self._derived_cache[cache_key]
 
         all_positions = []
         
@@ -124,78 +292,62 @@ class PortfolioService:
         stock_positions = holdings.get('positions', [])
         if stock_positions:
             self.logger.info(f"Processing {len(stock_positions)} stock position(s)")
-            for pos in stock_positions:
-                try:
-                    # Safely parse nested stock symbol data
-                    symbol_data = pos.get('symbol', {}).get('symbol', {})
-                    if not symbol_data:
-                        self.logger.warning(f"Skipping stock position with missing symbol_data: {pos}")
-                        continue
-                        
-                    type_desc = symbol_data.get('type', {}).get('description', 'Unknown')
-                    pos_type = "UNKNOWN"
-                    if 'Stock' in type_desc:
-                        pos_type = 'STK'
+            try:
+                df = _normalize_positions(stock_positions, _STOCK_FIELDS, 'symbol.symbol.symbol')
+                skipped = len(stock_positions) - len(df)
+                if skipped:
+                    self.logger.warning(f"Skipped {skipped} stock position(s) with missing symbol data")
                     
-                    position_data = {
-                        'symbol': symbol_data.get('symbol', 'N/A'),
-                        'position': pos.get('units', 0),
-                        'market_price': pos.get('price', 0),
-                        'market_value': pos.get('units', 0) * pos.get('price', 0),
-                        'avg_cost': pos.get('average_purchase_price', 0),
-                        'unrealized_pnl': pos.get('open_pnl', 0),
-                        'security_type': pos_type
-                    }
-                    all_positions.append(position_data)
-                except Exception as e:
-                    self.logger.warning(f"Error processing stock position: {e}")
+                type_desc = df['symbol.symbol.type.description'].astype(str)
+                security_type = np.where(type_desc.str.contains('Stock', regex=False), 'STK', 'UNKNOWN')
+                stocks = _position_columns(df, 'symbol.symbol.symbol', security_type)
+                all_positions.extend(Position(**rec) for rec in stocks.to_dict('records'))
+            except Exception as e:
+                self.logger.warning(f"Error processing stock positions: {e}")
 
         # 2. Process Option Positions (from 'option_positions' array)
         option_positions = holdings.get('option_positions', [])
         if option_positions:
             self.logger.info(f"Processing {len(option_positions)} option position(s)")
-            for pos in option_positions:
-                try:
-                    # Parse data based on the structure from your screenshot
-                    option_symbol_data = pos.get('symbol', {}).get('option_symbol', {})
-                    if not option_symbol_data:
-                        self.logger.warning(f"Skipping option position with missing option_symbol data: {pos}")
-                        continue
-
-                    # The underlying symbol (e.g., AAPL) is nested inside 'underlying_symbol'
-                    underlying_symbol_obj = option_symbol_data.get('underlying_symbol', {})
-                    # Use the main 'symbol' field of the underlying_symbol object
-                    underlying_symbol = underlying_symbol_obj.get('symbol', 'N/A')
+            try:
+                # The underlying symbol (e.g., AAPL) is nested inside 'underlying_symbol'
+                underlying_field = 'symbol.option_symbol.underlying_symbol.symbol'
+                df = _normalize_positions(option_positions, _OPTION_FIELDS, underlying_field)
+                skipped = len(option_positions) - len(df)
+                if skipped:
+                    self.logger.warning(f"Skipped {skipped} option position(s) with missing underlying symbol")
                     
-                    if underlying_symbol == 'N/A':
-                         self.logger.warning(f"Skipping option position with missing underlying symbol: {pos}")
-                         continue
-
-                    position_data = {
-                        'symbol': underlying_symbol, # Use the underlying as the main symbol
-                        'position': pos.get('units', 0),
-                        'market_price': pos.get('price', 0),
-                        'market_value': pos.get('units', 0) * pos.get('price', 0),
-                        'avg_cost': pos.get('average_purchase_price', 0),
-                        'unrealized_pnl': pos.get('open_pnl', 0),
-                        'security_type': 'OPT',
-                        'expiration': option_symbol_data.get('expiration_date', '').replace('-', ''), # Format as YYYYMMDD
-                        'strike': option_symbol_data.get('strike_price', 0),
-                        'option_type': option_symbol_data.get('option_type', 'N/A').upper() # 'CALL' or 'PUT'
-                    }
-                    all_positions.append(position_data)
-                except Exception as e:
-                    self.logger.warning(f"Error processing option position: {e}")
+                options = _position_columns(df, underlying_field, 'OPT')  # Use the underlying as the main symbol
+                options['expiration'] = (df['symbol.option_symbol.expiration_date'].fillna('').astype(str)
+                                         .str.replace('-', '', regex=False))  # Format as YYYYMMDD
+                # Integer YYYYMMDD (0 when missing) for cheap date comparisons
+                options['expiration_int'] = pd.to_numeric(options['expiration'], errors='coerce').fillna(0).astype('int64')
+                options['strike'] = pd.to_numeric(df['symbol.option_symbol.strike_price'], errors='coerce').fillna(0)
+                options['option_type'] = df['symbol.option_symbol.option_type'].fillna('N/A').astype(str).str.upper()  # 'CALL' or 'PUT'
+                all_positions.extend(Position(**rec) for rec in options.to_dict('records'))
+            except Exception as e:
+                self.logger.warning(f"Error processing option positions: {e}")
 
         self.logger.info(f"Total processed positions (stocks + options): {len(all_positions)}")
-        return all_positions
+        
+        positions_by_type = {'STK': [], 'OPT': [], 'ALL': all_positions}
+        for pos in all_positions:
+            positions_by_type.setdefault(pos.security_type, []).append(pos)
+        self._derived_cache[cache_key] = positions_by_type
+        return positions_by_type
 
     def get_portfolio_summary(self):
         """
         Get account summary information from SnapTrade and translate it
         """
         try:
-            balances_data = self._get_balances() # This now returns a LIST or None
+            holdings = self._get_holdings_cache()
+            cache_key = ('summary', id(holdings))
+            if holdings and cache_key in self._derived_cache:
+                return self._derived_cache[cache_key]
+            
+            # Same snapshot as the cache key, so the result is memoized under the right one
+            balances_data = self._get_balances(holdings) # This now returns a LIST or None
             if balances_data is None:
                 self.logger.error("No balances data available for portfolio summary.")
                 return None
@@ -203,15 +355,12 @@ class PortfolioService:
             cash_balance = 0
             account_value = 0
             
-            # Iterate over the list of balance objects
+            # Index the list of balance objects by (type, currency code)
             if isinstance(balances_data, list):
-                for balance in balances_data:
-                    # Safely check for type
-                    if balance and balance.get('type') == 'cash' and balance.get('currency', {}).get('code') == 'USD':
-                        cash_balance = balance.get('value', 0)
-                    
-                    if balance and balance.get('type') == 'total' and balance.get('currency', {}).get('code') == 'USD':
-                        account_value = balance.get('value', 0)
+                idx = {(b.get('type'), b.get('currency', {}).get('code')): b.get('value', 0)
+                       for b in balances_data if b}
+                cash_balance = idx.get(('cash', 'USD'), 0)
+                account_value = idx.get(('total', 'USD'), 0)
 
             if account_value == 0 and cash_balance > 0:
                 account_value = cash_balance
@@ -220,7 +369,7 @@ class PortfolioService:
             excess_liquidity = 0
             leverage_percentage = 0
             
-            return {
+            result = {
                 'account_id': self.primary_account_id,
                 'cash_balance': cash_balance,
                 'account_value': account_value,
@@ -229,9 +378,11 @@ class PortfolioService:
                 'leverage_percentage': leverage_percentage,
                 'is_frozen': False
             }
+            if holdings:
+                self._derived_cache[cache_key] = result
+            return result
         except Exception as e:
-            self.logger.error(f"Error getting portfolio summary from SnapTrade: {e}")
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Error getting portfolio summary from SnapTrade: {e}")
             return None
     
     def get_positions(self, security_type=None):
@@ -239,19 +390,88 @@ class PortfolioService:
         Get portfolio positions from SnapTrade, already combined (stocks + options).
         """
         try:
-            all_positions = self._get_positions()
+            # No security_type returns everything
+            return [pos.to_dict() for pos in self._get_positions().get(security_type or 'ALL', [])]
             
-            if not security_type:
-                return all_positions # Return everything
+        except Exception as e:
+            self.logger.exception(f"Error in get_positions: {e}")
+            return []
+    
+    def _weekly_frame(self):
+        """
+        Build the frame of short option positions expiring by this Friday
+        
+        Returns:
+            tuple: (pd.DataFrame with the weekly income columns, this Friday as YYYY-MM-DD)
+        """
+        positions = self._get_positions()['OPT']
+        this_friday_int, this_friday_iso = _this_friday_for(date.today().toordinal())
+        
+        # Short options expiring by this Friday
+        df = pd.DataFrame([_weekly_source_values(pos) for pos in positions], columns=_WEEKLY_SOURCE_FIELDS)
+        expiration = df['expiration_int'].fillna(0)
+        mask = (df['position'] < 0) & (expiration > 0) & (expiration <= this_friday_int)
+        weekly = df.loc[mask].copy()
+        
+        contracts = weekly['position'].abs()
+        weekly['premium_per_contract'] = weekly['avg_cost']
+        weekly['income'] = weekly['avg_cost'] * contracts
+        weekly['commission'] = 0
+        # Notional (cash secured) only applies to puts
+        weekly['notional_value'] = (weekly['strike'] * 100 * contracts).where(weekly['option_type'].eq('PUT'))
+        return weekly, this_friday_iso
+        
+    def _weekly_totals(self, weekly=None, this_friday_iso=None):
+        """
+        Aggregate weekly option income without building per-position dicts
+        
+        Args:
+            weekly (pd.DataFrame, optional): Frame from _weekly_frame; built if omitted
+            this_friday_iso (str, optional): This Friday as YYYY-MM-DD, required with weekly
             
-            # Filter by security_type if requested
-            filtered_list = [pos for pos in all_positions if pos.get('security_type') == security_type]
-            return filtered_list
+        Returns:
+            dict: total_income, total_commission, positions_count, this_friday, total_put_notional
+        """
+        if weekly is None:
+            weekly, this_friday_iso = self._weekly_frame()
+        return {
+            'total_income': float(weekly['income'].sum()),
+            'total_commission': 0,
+            'positions_count': len(weekly),
+            'this_friday': this_friday_iso,
+            # NaN notional (calls) is skipped by sum()
+            'total_put_notional': float(weekly['notional_value'].sum())
+        }
+        
+    def _weekly_positions(self, weekly=None):
+        """
+        Build the per-position dicts for weekly option income
+        
+        Args:
+            weekly (pd.DataFrame, optional): Frame from _weekly_frame; built if omitted
             
+        Returns:
+            list: One dict per short option expiring by this Friday
+        """
+        if weekly is None:
+            weekly, _ = self._weekly_frame()
+        weekly = weekly[_WEEKLY_FIELDS].astype(object)
+        return weekly.where(weekly.notna(), None).to_dict('records')
+        
+    def get_weekly_option_totals(self):
+        """
+        Get only the aggregate figures of get_weekly_option_income
+        """
+        try:
+            holdings = self._get_holdings_cache()
+            cache_key = ('weekly', id(holdings))
+            if holdings and cache_key in self._derived_cache:
+                result = self._derived_cache[cache_key]
+                return {key: value for key, value in result.items() if key != 'positions'}
+            return self._weekly_totals()
         except Exception as e:
-            self.logger.error(f"Error in get_positions: {e}")
-            self.logger.error(traceback.format_exc())
-            return []
+            self.logger.exception("Error getting weekly option totals: %s", e)
+            return {'error': str(e), 'total_income': 0, 'positions_count': 0}
     
     def get_weekly_option_income(self):
         """
@@ -259,56 +479,19 @@ class PortfolioService:
         This method works as-is because it relies on get_positions('OPT').
         """
         try:
-            positions = self.get_positions('OPT')
-            
-            today = datetime.now()
-            days_until_friday = (4 - today.weekday()) % 7
-            this_friday = today + timedelta(days=days_until_friday)
-            this_friday_str = this_friday.strftime('%Y%m%d')
-            
-            weekly_positions = []
-            total_income = 0
-            
-            for pos in positions:
-                if pos.get('position', 0) >= 0:
-                    continue
-                    
-                if pos.get('expiration') and pos.get('expiration') <= this_friday_str:
-                    contracts = abs(pos.get('position', 0))
-                    premium_per_contract = pos.get('avg_cost', 0)
-                    income = premium_per_contract * contracts
-                    total_income += income
-                    
-                    notional_value = None
-                    if pos.get('option_type') == 'PUT':
-                        strike = pos.get('strike', 0)
-                        notional_value = strike * 100 * contracts
-                    
-                    weekly_positions.append({
-                        'symbol': pos.get('symbol', ''),
-                        'option_type': pos.get('option_type', ''),
-                        'strike': pos.get('strike', 0),
-                        'expiration': pos.get('expiration', ''),
-                        'position': pos.get('position', 0),
-                        'premium_per_contract': premium_per_contract,
-                        'avg_cost': premium_per_contract,
-                        'income': income,
-                        'commission': 0,
-                        'notional_value': notional_value
-                    })
+            holdings = self._get_holdings_cache()
+            cache_key = ('weekly', id(holdings))
+            if holdings and cache_key in self._derived_cache:
+                return self._derived_cache[cache_key]
             
-            result = {
-                'positions': weekly_positions,
-                'total_income': total_income,
-                'total_commission': 0,
-                'positions_count': len(weekly_positions),
-                'this_friday': this_friday.strftime('%Y-%m-%d'),
-                'total_put_notional': sum(p.get('notional_value', 0) for p in weekly_positions if p.get('option_type') == 'PUT')
-            }
+            weekly, this_friday_iso = self._weekly_frame()
+            result = {'positions': self._weekly_positions(weekly)}
+            result.update(self._weekly_totals(weekly, this_friday_iso))
             
+            if holdings:
+                self._derived_cache[cache_key] = result
             return result
         except Exception as e:
-            self.logger.error(f"Error getting weekly option income: {e}")
-            self.logger.error(traceback.format_exc())
-            return {'positions': [], 'total_income': 0, 'positions_count': 0}
+            self.logger.exception("Error getting weekly option income: %s", e)
+            return {'error': str(e), 'positions': [], 'total_income': 0, 'positions_count': 0}
 
@@ -4,17 +4,41 @@ Main entry point for the web application
 """
 
 import os
-import json
-from flask import Flask, render_template, request, redirect, url_for, jsonify
+import hashlib
+try:
+    import orjson as _json
+except ImportError:  # fall back to the stdlib parser
+    import json as _json
+from flask import Flask, render_template, request, redirect, url_for, jsonify, make_response
 from api import create_app
+from api.routes.portfolio import portfolio_service
 from core.logging_config import get_logger
-from db.database import OptionsDatabase
+from db.database import get_database
 # We are no longer importing IBConnection here, it's handled by the services
 # from core.connection import IBConnection, suppress_ib_logs
 
 # Configure logging
 logger = get_logger('autotrader.app', 'api')
 
+def _register_lazy_database(app, db_path):
+    """
+    Defer opening the options database until the first request, so
+    importing the app (e.g. in every gunicorn worker) stays cheap
+    
+    Args:
+        app (Flask): The application to attach the database to
+        db_path (str): Path to the SQLite database, or None to skip
+    """
+    if not db_path:
+        return
+    
+    @app.before_request
+    def _ensure_database():
+        # get_database creates the shared handle at most once, even under concurrent requests
+        if app.db is None:
+            logger.info(f"Initializing database at {db_path}")
+            app.db = app.config['database'] = get_database(db_path)
+
 # Create Flask application with necessary configs
 def create_application():
     # Create the app through the factory function
@@ -28,16 +52,11 @@ def create_application():
     
     if os.path.exists(connection_config_path):
         try:
-            with open(connection_config_path, 'r') as f:
-                connection_config = json.load(f)
+            with open(connection_config_path, 'rb') as f:
+                connection_config = _json.loads(f.read())
                 logger.info(f"Loaded connection configuration from {connection_config_path}")
-                # Initialize the database
-                db_path = connection_config.get('db_path') # Use .get() for safety
-                if db_path:
-                    logger.info(f"Initializing database at {db_path}")
-                    options_db = OptionsDatabase(db_path)
-                    app.config['database'] = options_db
-                else:
+                # The database itself is opened lazily on the first request
+                if not connection_config.get('db_path'): # Use .get() for safety
                     logger.warning("db_path not found in config, database not initialized.")
         except Exception as e:
             logger.error(f"Error loading connection configuration: {str(e)}")
@@ -57,6 +76,9 @@ def create_application():
     app.config['connection_config'] = connection_config
     logger.info(f"Using connection config (keys partially masked)")
     
+    # Open the database on the first request instead of at import time
+    _register_lazy_database(app, connection_config.get('db_path'))
+    
     # Import and register the new SnapTrade blueprint
     try:
         from api.routes import snaptrade
@@ -70,6 +92,27 @@ def create_application():
 # Create the application
 app = create_application()
 
+# Pages without per-request data, rendered once at startup and keyed by URL path
+CACHED_PAGES = {
+    '/': 'dashboard.html',
+    '/portfolio': 'portfolio.html',
+    '/rollover': 'rollover.html',
+}
+PAGE_MAX_AGE = 300
+
+def cached_page(path):
+    """
+    Serve a pre-rendered page with its ETag, answering 304 Not Modified
+    when the client already has the current version
+    """
+    html, etag = app.config['PAGE_CACHE'][path]
+    response = make_response(html)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = PAGE_MAX_AGE
+    response.cache_control.must_revalidate = True
+    return response.make_conditional(request)
+
 # Web routes
 @app.route('/')
 def index():
@@ -77,7 +120,8 @@ def index():
     Render the dashboard page
     """
     logger.info("Rendering dashboard page")
-    return render_template('dashboard.html')
+    portfolio_service.prefetch()
+    return cached_page('/')
 
 @app.route('/portfolio')
 def portfolio():
@@ -85,7 +129,8 @@ def portfolio():
     Render the portfolio page
     """
     logger.info("Rendering portfolio page")
-    return render_template('portfolio.html')
+    portfolio_service.prefetch()
+    return cached_page('/portfolio')
 
 @app.route('/options')
 def options():
@@ -101,7 +146,7 @@ def rollover():
     Render the rollover page for options approaching strike price
     """
     logger.info("Rendering rollover page")
-    return render_template('rollover.html')
+    return cached_page('/rollover')
 
 @app.route('/recommendations')
 def recommendations():
@@ -117,7 +162,7 @@ def page_not_found(e):
     Handle 404 errors
     """
     logger.warning(f"404 error: {request.path}")
-    return render_template('error.html', error_code=404, message="Page not found"), 404
+    return app.config['ERROR_404_HTML'], 404
 
 @app.errorhandler(500)
 def server_error(e):
@@ -125,7 +170,27 @@ def server_error(e):
     Handle 500 errors
     """
     logger.error(f"500 error: {str(e)}")
-    return render_template('error.html', error_code=500, message="Server error"), 500
+    return app.config['ERROR_500_HTML'], 500
+
+def prerender_pages(app):
+    """
+    Render the static pages and error pages once so the routes can return cached HTML.
+    Must run after the routes are registered, since the templates link to them.
+    Each page is rendered under its own path so the navigation marks it active.
+    """
+    page_cache = {}
+    for path, template in CACHED_PAGES.items():
+        with app.test_request_context(path):
+            html = render_template(template)
+        page_cache[path] = (html, hashlib.md5(html.encode()).hexdigest())
+    app.config['PAGE_CACHE'] = page_cache
+    
+    # Render errors under a path no navigation link matches
+    with app.test_request_context('/error'):
+        app.config['ERROR_404_HTML'] = render_template('error.html', error_code=404, message="Page not found")
+        app.config['ERROR_500_HTML'] = render_template('error.html', error_code=500, message="Server error")
+
+prerender_pages(app)
 
 if __name__ == '__main__':
     # Get port from environment variable or use default
@@ -1,9 +1,18 @@
 import os
 import json
 import logging
+import functools
+from types import MappingProxyType
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger('autotrader.config')
 
+# Parsed config files keyed by path, as ((mtime_ns, size), parsed dict)
+_PARSED_CACHE = {}
+
 class Config:
     """
     Configuration class for the AutoTrader application
@@ -20,6 +29,9 @@ class Config:
         # Initialize with default values
         self.config = default_config.copy() if default_config else {}
         self.config_file_path = None # Store the path
+        # Read-only live view of the configuration
+        self.values = MappingProxyType(self.config)
+        self._flatten()
         
         # If config_file is not provided, check environment variable
         if config_file is None:
@@ -47,17 +59,37 @@ class Config:
             bool: True if successful, False otherwise
         """
         try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
+            # Skip the read and parse when the file hasn't changed since last time
+            st = os.stat(config_file)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _PARSED_CACHE.get(config_file)
+            if cached and cached[0] == stamp:
+                file_config = cached[1]
+            else:
+                with open(config_file, 'rb') as f:
+                    data = f.read()
+                file_config = orjson.loads(data) if orjson else json.loads(data)
+                _PARSED_CACHE[config_file] = (stamp, file_config)
                 
             # Update our configuration with values from the file
             self.config.update(file_config)
             self.config_file_path = config_file # Store the path
+            self._flatten()
             return True
         except Exception as e:
             logger.error(f"Error loading configuration from {config_file}: {str(e)}")
             return False
             
+    def _flatten(self):
+        """
+        Mirror every configuration value onto a '_cfg_<key>' instance
+        attribute so get() is a plain attribute lookup
+        """
+        for name in [name for name in vars(self) if name.startswith('_cfg_')]:
+            delattr(self, name)
+        for key, value in self.config.items():
+            setattr(self, '_cfg_' + key, value)
+            
     def get(self, key, default=None):
         """
         Get a configuration value
@@ -69,7 +101,7 @@ class Config:
         Returns:
             The configuration value or default
         """
-        return self.config.get(key, default)
+        return getattr(self, '_cfg_' + key, default)
         
     def set(self, key, value):
         """
@@ -80,6 +112,7 @@ class Config:
             value: Value to set
         """
         self.config[key] = value
+        setattr(self, '_cfg_' + key, value)
         
     def to_dict(self):
         """
@@ -102,10 +135,34 @@ class Config:
             return False
             
         try:
-            with open(self.config_file_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            if orjson:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode()
+            with open(self.config_file_path, 'wb') as f:
+                f.write(data)
             logger.info(f"Successfully saved config to {self.config_file_path}")
             return True
         except Exception as e:
             logger.error(f"Error saving configuration to {self.config_file_path}: {str(e)}")
             return False
+
+@functools.lru_cache(maxsize=1)
+def load_config(config_file=None):
+    """
+    Get the process-wide Config instance, parsing the file only on first use
+    
+    Args:
+        config_file (str, optional): Path to a JSON configuration file. Defaults to None
+            (CONNECTION_CONFIG environment variable or connection.json).
+            
+    Returns:
+        Config: Shared configuration instance
+    """
+    return Config(config_file=config_file)
+
+def reload_config():
+    """
+    Drop the cached configuration so the next load_config() re-reads the file
+    """
+    load_config.cache_clear()
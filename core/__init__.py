@@ -14,11 +14,17 @@ from .utils import (
     get_strikes_around_price
 )
 
-# Import connection classes
-from .connection import SnapTradeConnection
+# Connection classes are imported on first access (PEP 562) so that
+# importing core doesn't pull in the SnapTrade SDK
+def __getattr__(name):
+    if name == 'SnapTradeConnection':
+        from .connection import SnapTradeConnection
+        return SnapTradeConnection
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     # Connection    
+    'SnapTradeConnection',
     # Utils
     'rotate_logs',
     'rotate_reports',
@@ -5,13 +5,19 @@ Replaces IBConnection
 
 import logging
 import snaptrade_client
+from snaptrade_client.configuration import Configuration
 from snaptrade_client.rest import ApiException
-from config import Config
+from urllib3.util.retry import Retry
+from config import load_config
 from core.logging_config import get_logger
 
 # Configure logging
 logger = get_logger('autotrader.connection', 'snaptrade')
 
+# Keep-alive pool settings for the SDK's urllib3 PoolManager
+POOL_MAXSIZE = 8
+POOL_RETRIES = Retry(total=3, backoff_factor=0.25)
+
 class SnapTradeConnection:
     """
     Class for managing connection and data retrieval from SnapTrade
@@ -20,7 +26,7 @@ class SnapTradeConnection:
         """
         Initialize the SnapTrade connection client
         """
-        self.config = Config()
+        self.config = load_config()
         self.client_id = self.config.get('snaptrade_client_id')
         self.consumer_key = self.config.get('snaptrade_consumer_key')
         self.user_id = self.config.get('snaptrade_user_id')
@@ -44,11 +50,15 @@ class SnapTradeConnection:
             return False
             
         try:
-            # Initialize the SnapTrade client
-            self.snaptrade = snaptrade_client.SnapTrade(
+            # Initialize the SnapTrade client on a persistent, retrying
+            # connection pool so repeated calls reuse the same TLS session
+            configuration = Configuration(
                 client_id=self.client_id,
                 consumer_key=self.consumer_key,
             )
+            configuration.connection_pool_maxsize = POOL_MAXSIZE
+            configuration.retries = POOL_RETRIES
+            self.snaptrade = snaptrade_client.SnapTrade(configuration)
             
             # Test the connection by checking API status
             api_response = self.snaptrade.api_status.check()
@@ -2,7 +2,7 @@
 Currency conversion and currency-related utilities for AllYouNeedIsWheel
 """
 
-from currency_converter import CurrencyConverter
+import functools
 import logging
 
 logger = logging.getLogger('autotrader.currency')
@@ -10,19 +10,36 @@ logger = logging.getLogger('autotrader.currency')
 BASE_CURRENCY = 'USD'
 
 class CurrencyHelper:
-    converter = CurrencyConverter()
+    # Built on first use; CurrencyConverter parses its bundled ECB rates file
+    converter = None
+
+    @classmethod
+    def get_converter(cls):
+        if cls.converter is None:
+            from currency_converter import CurrencyConverter
+            cls.converter = CurrencyConverter()
+        return cls.converter
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _rate(from_currency, to_currency):
+        # Rates are fixed for the life of the process, so each pair is looked up once.
+        # Failures raise, so lru_cache doesn't store them and the next call retries
+        return CurrencyHelper.get_converter().convert(1, from_currency, to_currency)
 
     @staticmethod
     def get_exchange_rate(from_currency, to_currency=BASE_CURRENCY):
         if from_currency == to_currency:
             return 1.0
         try:
-            return CurrencyHelper.converter.convert(1, from_currency, to_currency)
+            return CurrencyHelper._rate(from_currency, to_currency)
         except Exception as e:
             logger.warning(f"Could not get exchange rate for {from_currency} to {to_currency}: {e}")
             return 1.0
 
     @staticmethod
     def convert_amount(amount, from_currency, to_currency=BASE_CURRENCY):
-        rate = CurrencyHelper.get_exchange_rate(from_currency, to_currency)
-        return amount * rate
+        # Nothing to convert for zero amounts or same-currency positions
+        if not amount or from_currency == to_currency:
+            return amount
+        return amount * CurrencyHelper.get_exchange_rate(from_currency, to_currency)
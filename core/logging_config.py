@@ -5,9 +5,10 @@ Centralized logging configuration module for the Auto-Trader application
 import os
 import time
 import logging
-import glob
+import threading
 import heapq
-from logging.handlers import RotatingFileHandler
+import fnmatch
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
 
 # Base directory for logs
@@ -17,13 +18,148 @@ LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__
 for subdir in ['api', 'tws', 'server', 'general', 'snaptrade']:
     os.makedirs(os.path.join(LOGS_DIR, subdir), exist_ok=True)
 
+# Records buffered before a file write; WARNING and above flush immediately
+LOG_BUFFER_CAPACITY = 32
+# Seconds buffered records may wait before the background flush writes them
+LOG_FLUSH_INTERVAL = 1.0
+
+# One buffered handler per log file, shared by every logger writing to it
+_file_handlers = {}
+_file_handlers_lock = threading.Lock()
+_flusher = None
+
+# Log types whose old files were already pruned by this process
+_pruned = set()
+_prune_lock = threading.Lock()
+
 # Log file name format with timestamp
 TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
 
+class _DeferredFlushFileHandler(logging.FileHandler):
+    """
+    FileHandler that leaves flushing to the MemoryHandler feeding it, so a
+    batch of records reaches the OS in a few buffered write() calls
+    """
+    def flush(self):
+        pass
+        
+    def flush_stream(self):
+        super().flush()
+
+class _BatchingHandler(MemoryHandler):
+    """
+    MemoryHandler that flushes its target's stream once per batch
+    """
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target:
+                self.target.flush_stream()
+                
+    def close(self):
+        # A closed handler must not be handed out again by buffered_file_handler
+        with _file_handlers_lock:
+            for key in [key for key, handler in _file_handlers.items() if handler is self]:
+                del _file_handlers[key]
+        super().close()
+
+def _flush_file_handlers():
+    """Write out buffered records every LOG_FLUSH_INTERVAL seconds"""
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        with _file_handlers_lock:
+            handlers = list(_file_handlers.values())
+        for handler in handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+def buffered_file_handler(log_file, level, formatter):
+    """
+    Get the shared handler for log_file, creating it on first use. Records
+    are written in batches of up to LOG_BUFFER_CAPACITY, at least every
+    LOG_FLUSH_INTERVAL seconds; WARNING and above flush immediately
+    
+    Args:
+        log_file (str): Path of the log file
+        level (int): Minimum level written to the file
+        formatter (logging.Formatter): Formatter for file records (first caller wins)
+        
+    Returns:
+        logging.Handler: Handler to add to a logger
+    """
+    global _flusher
+    key = os.path.abspath(log_file)
+    with _file_handlers_lock:
+        handler = _file_handlers.get(key)
+        if handler is None:
+            file_handler = _DeferredFlushFileHandler(log_file, encoding='utf-8')
+            file_handler.setLevel(logging.NOTSET)
+            file_handler.setFormatter(formatter)
+            handler = _BatchingHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING,
+                                       target=file_handler, flushOnClose=True)
+            handler.setLevel(level)
+            _file_handlers[key] = handler
+        elif level < handler.level:
+            handler.setLevel(level)
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_file_handlers, name='log-flusher', daemon=True)
+            _flusher.start()
+    return handler
+
 def get_log_path(log_type):
     """Get the path for a specific log type with timestamp"""
     return os.path.join(LOGS_DIR, log_type, f"{log_type}_{TIMESTAMP}.log")
 
+def _prune_by_mtime(directory, pattern, keep, label='file'):
+    """
+    Delete the oldest files matching a glob pattern, keeping the newest ones
+    
+    Args:
+        directory (str): Directory to prune
+        pattern (str): Glob pattern for file names (e.g. 'api_*.log')
+        keep (int): Number of most recent files to keep
+        label (str): Description of the files for status messages
+        
+    Returns:
+        list: Paths of the removed files
+    """
+    # Collect matching files and their modification times in one directory
+    # pass (DirEntry caches the stat result)
+    files_with_mtime = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                try:
+                    if entry.is_file():
+                        files_with_mtime.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    # Another worker likely deleted this file, just skip it
+                    print(f"{label.capitalize()} {entry.path} not found, skipping cleanup for this file.")
+    except FileNotFoundError:
+        return []
+    
+    # Pick only the oldest files instead of sorting them all
+    delete_count = len(files_with_mtime) - keep
+    if delete_count <= 0:
+        return []
+    
+    removed = []
+    for mtime, old_file in heapq.nsmallest(delete_count, files_with_mtime, key=lambda x: x[0]):
+        try:
+            os.remove(old_file)
+            removed.append(old_file)
+            print(f"Removed old {label}: {old_file}")
+        except FileNotFoundError:
+            # This is fine, means another worker got to it first
+            print(f"Could not remove {old_file}, already deleted.")
+        except Exception as e:
+            print(f"Error removing {label} {old_file}: {e}")
+    return removed
+
 def cleanup_old_logs(log_type, max_logs=5):
     """
     Cleanup old log files, keeping only the latest N logs
@@ -32,46 +168,7 @@ def cleanup_old_logs(log_type, max_logs=5):
         log_type (str): Type of log ('api', 'tws', 'server', 'general', 'snaptrade')
         max_logs (int): Number of log files to keep (default: 5)
     """
-    log_dir = os.path.join(LOGS_DIR, log_type)
-    log_pattern = os.path.join(log_dir, f"{log_type}_*.log")
-    
-    # Get all log files for this type
-    log_files = glob.glob(log_pattern)
-    
-    # If we have more logs than the maximum, remove the oldest ones
-    if len(log_files) > max_logs:
-        # === FIX: Wrap sorting in a try...except to handle race conditions ===
-        # Get modification times safely
-        logs_with_mtime = []
-        for log in log_files:
-            try:
-                mtime = os.path.getmtime(log)
-                logs_with_mtime.append((mtime, log))
-            except FileNotFoundError:
-                # Another worker likely deleted this file, just skip it
-                print(f"Log file {log} not found, skipping cleanup for this file.")
-                continue
-
-        # Sort by modification time (oldest first)
-        logs_with_mtime.sort(key=lambda x: x[0])
-        
-        # Determine how many to delete (keep the newest max_logs)
-        logs_to_delete_count = len(logs_with_mtime) - max_logs
-        if logs_to_delete_count > 0:
-            logs_to_delete = logs_with_mtime[:logs_to_delete_count]
-        else:
-            logs_to_delete = []
-
-        # Remove older logs
-        for mtime, old_log in logs_to_delete:
-            try:
-                os.remove(old_log)
-                print(f"Removed old log file: {old_log}")
-            except FileNotFoundError:
-                # This is fine, means another worker got to it first
-                print(f"Could not remove {old_log}, already deleted.")
-            except Exception as e:
-                print(f"Error removing log file {old_log}: {e}")
+    _prune_by_mtime(os.path.join(LOGS_DIR, log_type), f"{log_type}_*.log", max_logs, label='log file')
 
 def configure_logging(module_name, log_type=None, console_level=logging.INFO, file_level=logging.DEBUG):
     """
@@ -90,20 +187,29 @@ def configure_logging(module_name, log_type=None, console_level=logging.INFO, fi
     if not log_type:
         log_type = 'general'
     
-    # First, clean up old logs to maintain only max_logs=5
-    try:
-        cleanup_old_logs(log_type, max_logs=5)
-    except Exception as e:
-        # Don't let a logging race condition crash the app
-        print(f"Warning: Failed to clean up old logs. Error: {e}")
+    # First, clean up old logs to maintain only max_logs=5 (once per log type)
+    with _prune_lock:
+        if log_type not in _pruned:
+            _pruned.add(log_type)
+            try:
+                cleanup_old_logs(log_type, max_logs=5)
+            except Exception as e:
+                # Don't let a logging race condition crash the app
+                print(f"Warning: Failed to clean up old logs. Error: {e}")
     
     # Create logger
     logger = logging.getLogger(module_name)
     logger.setLevel(logging.DEBUG)  # Capture all levels
     
-    # Remove existing handlers if any (prevents duplicate logging)
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    # Remove handlers from an earlier configure_logging call (prevents duplicate
+    # logging). Console handlers are closed; the file handler is only flushed,
+    # since other loggers share it. Handlers added by callers are left alone.
+    for handler in [h for h in logger.handlers if getattr(h, '_autotrader', False)]:
+        logger.removeHandler(handler)
+        if isinstance(handler, _BatchingHandler):
+            handler.flush()
+        else:
+            handler.close()
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -117,15 +223,16 @@ def configure_logging(module_name, log_type=None, console_level=logging.INFO, fi
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
     
     # File handler - we create a new timestamped file for each run 
     # but limit the total number of log files
     log_file = get_log_path(log_type)
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(file_level)
-    file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+    # Batch records into fewer write() calls; shared by every logger of this log type
+    file_handler = buffered_file_handler(log_file, file_level, detailed_formatter)
+    
+    for handler in (console_handler, file_handler):
+        handler._autotrader = True
+        logger.addHandler(handler)
     
     # Log startup information
     logger.info(f"Logging initialized for {module_name} to {log_file}")
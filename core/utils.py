@@ -3,15 +3,30 @@ Utility functions for the autotrader package
 """
 
 import os
-import glob
 import logging
-from datetime import datetime, timedelta, time as datetime_time
+from datetime import date, datetime, timedelta, time as datetime_time
 import math
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .logging_config import _BatchingHandler, _prune_by_mtime, buffered_file_handler
 
 # Configure logger
 logger = logging.getLogger('autotrader.utils')
 
+# US market timezone and session boundaries (ET)
+try:
+    _ET = ZoneInfo('US/Eastern')
+except ZoneInfoNotFoundError:  # no system tz database (e.g. Windows without tzdata)
+    import pytz
+    _ET = pytz.timezone('US/Eastern')
+_MARKET_OPEN = datetime_time(9, 30)
+_MARKET_CLOSE = datetime_time(16, 0)
+_PRE_MARKET_OPEN = datetime_time(4, 0)
+_AFTER_HOURS_CLOSE = datetime_time(20, 0)
+
+# Days from each weekday (0 is Monday) to the next Friday, 0 on a Friday
+_DAYS_TO_FRIDAY = (4, 3, 2, 1, 0, 6, 5)
+
 def rotate_logs(logs_dir='logs', max_logs=5):
     """
     Rotate log files, keeping only the specified number of most recent logs.
@@ -20,24 +35,7 @@ def rotate_logs(logs_dir='logs', max_logs=5):
         logs_dir (str): Directory containing log files
         max_logs (int): Maximum number of log files to keep
     """
-    # Get all log files in the logs directory
-    log_files = glob.glob(os.path.join(logs_dir, 'trader_*.log'))
-    
-    # If we don't have too many logs yet, no need to delete any
-    if len(log_files) <= max_logs:
-        return
-    
-    # Sort log files by modification time (newest first)
-    sorted_logs = sorted(log_files, key=os.path.getmtime, reverse=True)
-    
-    # Keep only the most recent logs, delete others
-    logs_to_delete = sorted_logs[max_logs:]
-    for log_file in logs_to_delete:
-        try:
-            os.remove(log_file)
-            print(f"Deleted old log file: {log_file}")
-        except Exception as e:
-            print(f"Error deleting log file {log_file}: {e}")
+    _prune_by_mtime(logs_dir, 'trader_*.log', max_logs, label='log file')
 
 def rotate_reports(reports_dir='reports', max_reports=5):
     """
@@ -47,24 +45,7 @@ def rotate_reports(reports_dir='reports', max_reports=5):
         reports_dir (str): Directory containing HTML report files
         max_reports (int): Maximum number of report files to keep
     """
-    # Get all HTML report files in the reports directory
-    report_files = glob.glob(os.path.join(reports_dir, 'options_report_*.html'))
-    
-    # If we don't have too many reports yet, no need to delete any
-    if len(report_files) <= max_reports:
-        return
-    
-    # Sort report files by modification time (newest first)
-    sorted_reports = sorted(report_files, key=os.path.getmtime, reverse=True)
-    
-    # Keep only the most recent reports, delete others
-    reports_to_delete = sorted_reports[max_reports:]
-    for report_file in reports_to_delete:
-        try:
-            os.remove(report_file)
-            print(f"Deleted old report file: {report_file}")
-        except Exception as e:
-            print(f"Error deleting report file {report_file}: {e}")
+    _prune_by_mtime(reports_dir, 'options_report_*.html', max_reports, label='report file')
 
 def setup_logging(logs_dir='logs', log_prefix='trader', log_level=logging.DEBUG):
     """
@@ -84,10 +65,8 @@ def setup_logging(logs_dir='logs', log_prefix='trader', log_level=logging.DEBUG)
     # Rotate logs on startup
     rotate_logs(logs_dir=logs_dir, max_logs=5)
     
-    # Set up file handler for all logs
+    # Log file for this run
     log_file = os.path.join(logs_dir, f"{log_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)  # Capture all logs in file
     
     # Set up console handler for important messages only
     console_handler = logging.StreamHandler()
@@ -97,21 +76,30 @@ def setup_logging(logs_dir='logs', log_prefix='trader', log_level=logging.DEBUG)
     file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console_formatter = logging.Formatter('%(levelname)s: %(message)s')
     
-    # Set formatters
-    file_handler.setFormatter(file_formatter)
+    # Buffered file handler for all logs (capture all levels in file)
+    file_handler = buffered_file_handler(log_file, logging.DEBUG, file_formatter)
+    
+    # Set console formatter
     console_handler.setFormatter(console_formatter)
     
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Clear any existing handlers
-    for handler in root_logger.handlers[:]:
+    # Remove handlers from an earlier setup_logging call. The console handler is
+    # closed; the shared file handler is only flushed. Handlers installed by
+    # anything else (gunicorn, pytest, ...) are left alone.
+    for handler in [h for h in root_logger.handlers if getattr(h, '_autotrader', False)]:
         root_logger.removeHandler(handler)
+        if isinstance(handler, _BatchingHandler):
+            handler.flush()
+        else:
+            handler.close()
     
-    # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Add handlers, tagged so a later call knows which ones are its own
+    for handler in (file_handler, console_handler):
+        handler._autotrader = True
+        root_logger.addHandler(handler)
     
     # Set ib_insync loggers to WARNING level to reduce noise
     logging.getLogger('ib_insync').setLevel(logging.WARNING)
@@ -129,22 +117,22 @@ def get_closest_friday():
     Returns:
         datetime.date: Date of the closest Friday
     """
-    today = datetime.now().date()
-    
-    # Get the day of the week (0 is Monday, 4 is Friday)
-    weekday = today.weekday()
-    
-    # Calculate days until Friday
-    if weekday < 4:  # Monday to Thursday
-        days_to_add = 4 - weekday
-    elif weekday == 4:  # Friday
-        days_to_add = 0
-    else:  # Weekend
-        days_to_add = 4 + (7 - weekday)  # Next Friday
+    today = date.today()
+    days_to_add = _DAYS_TO_FRIDAY[today.weekday()]
     
     closest_friday = today + timedelta(days=days_to_add)
     return closest_friday
 
+def _first_friday(year, month):
+    """
+    Get the first Friday of a month
+    
+    Returns:
+        datetime.date: Date of the first Friday
+    """
+    first_day = date(year, month, 1)
+    return first_day + timedelta(days=_DAYS_TO_FRIDAY[first_day.weekday()])
+
 def get_next_monthly_expiration():
     """
     Get the next monthly options expiration date (3rd Friday of the month)
@@ -152,46 +140,18 @@ def get_next_monthly_expiration():
     Returns:
         str: Next monthly expiration date in YYYYMMDD format
     """
-    today = datetime.now().date()
-    
-    # Start with the current month
-    year = today.year
-    month = today.month
-    
-    # Find the first day of the month
-    first_day = datetime(year, month, 1).date()
-    
-    # Find the first Friday of the month
-    weekday = first_day.weekday()
-    if weekday < 4:  # Monday to Thursday
-        days_to_add = 4 - weekday
-    else:  # Friday to Sunday
-        days_to_add = 4 + (7 - weekday)
-    
-    first_friday = first_day + timedelta(days=days_to_add)
+    today = date.today()
     
     # The third Friday is 14 days after the first Friday
-    third_friday = first_friday + timedelta(days=14)
+    third_friday = _first_friday(today.year, today.month) + timedelta(days=14)
     
     # If the third Friday is in the past, move to next month
     if third_friday < today:
-        if month == 12:
-            year += 1
-            month = 1
+        if today.month == 12:
+            year, month = today.year + 1, 1
         else:
-            month += 1
-            
-        first_day = datetime(year, month, 1).date()
-        
-        # Find the first Friday of the next month
-        weekday = first_day.weekday()
-        if weekday < 4:  # Monday to Thursday
-            days_to_add = 4 - weekday
-        else:  # Friday to Sunday
-            days_to_add = 4 + (7 - weekday)
-        
-        first_friday = first_day + timedelta(days=days_to_add)
-        third_friday = first_friday + timedelta(days=14)
+            year, month = today.year, today.month + 1
+        third_friday = _first_friday(year, month) + timedelta(days=14)
     
     # Format as YYYYMMDD
     return third_friday.strftime('%Y%m%d')
@@ -206,7 +166,10 @@ def parse_date_string(date_str):
     Returns:
         datetime: Datetime object
     """
-    return datetime.strptime(date_str, "%Y%m%d")
+    # Fixed-width format, so slice instead of going through strptime
+    if len(date_str) != 8 or not (date_str.isascii() and date_str.isdigit()):
+        raise ValueError(f"time data {date_str!r} does not match format '%Y%m%d'")
+    return datetime(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
 
 def format_date_string(date_obj):
     """
@@ -218,7 +181,7 @@ def format_date_string(date_obj):
     Returns:
         str: Date string in YYYYMMDD format
     """
-    return date_obj.strftime("%Y%m%d")
+    return f"{date_obj.year:04d}{date_obj.month:02d}{date_obj.day:02d}"
 
 def format_currency(value):
     """Format a value as currency"""
@@ -244,23 +207,12 @@ def get_strikes_around_price(price, interval, num_strikes):
     Returns:
         list: List of strike prices
     """
-    strikes = []
-    
     # Find the nearest strike below the current price
     nearest_strike_below = math.floor(price / interval) * interval
     
-    # Generate strikes below the price
-    for i in range(num_strikes // 2, 0, -1):
-        strikes.append(nearest_strike_below - (i * interval))
-    
-    # Add the nearest strike below
-    strikes.append(nearest_strike_below)
-    
-    # Generate strikes above the price
-    for i in range(1, num_strikes // 2 + 1):
-        strikes.append(nearest_strike_below + (i * interval))
-    
-    return strikes
+    # Arithmetic progression from half below to half above the nearest strike
+    half = num_strikes // 2
+    return [nearest_strike_below + (i * interval) for i in range(-half, half + 1)]
 
 def is_market_hours(include_after_hours=False):
     """
@@ -286,8 +238,7 @@ def is_market_hours(include_after_hours=False):
         True
     """
     # Get the current time in ET
-    eastern = pytz.timezone('US/Eastern')
-    now = datetime.now(eastern)
+    now = datetime.now(_ET)
     
     # Check if it's a weekend
     if now.weekday() >= 5:  # 5 is Saturday, 6 is Sunday
@@ -296,29 +247,21 @@ def is_market_hours(include_after_hours=False):
     # Current time
     current_time = now.time()
     
-    # Regular market hours check (9:30 AM to 4:00 PM ET)
-    market_open = datetime_time(9, 30)
-    market_close = datetime_time(16, 0)
-    
-    # Regular market hours
-    if market_open <= current_time <= market_close:
+    # Regular market hours (9:30 AM to 4:00 PM ET)
+    if _MARKET_OPEN <= current_time <= _MARKET_CLOSE:
         return True
     
     # If we're not including after-hours, then we're done
     if not include_after_hours:
         return False
     
-    # Extended hours check
-    pre_market_open = datetime_time(4, 0)
-    after_hours_close = datetime_time(20, 0)
-    
     # Pre-market (4:00 AM - 9:30 AM ET)
-    if pre_market_open <= current_time < market_open:
+    if _PRE_MARKET_OPEN <= current_time < _MARKET_OPEN:
         return True
     
     # After-hours (4:00 PM - 8:00 PM ET)
-    if market_close < current_time <= after_hours_close:
+    if _MARKET_CLOSE < current_time <= _AFTER_HOURS_CLOSE:
         return True
     
     # Not market hours
-    return False 
\ No newline at end of file
+    return False
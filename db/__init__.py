@@ -2,6 +2,6 @@
 Database package for SQLite logging
 """
 
-from .database import OptionsDatabase
+from .database import OptionsDatabase, get_database
 
-__all__ = ['OptionsDatabase'] 
\ No newline at end of file
+__all__ = ['OptionsDatabase', 'get_database'] 
@@ -4,15 +4,79 @@ Database module for SQLite logging of trades
 
 import sqlite3
 import os
+import atexit
+import threading
 import json
-from datetime import datetime
+from itertools import combinations
 from pathlib import Path
 import traceback
 
+# Fixed statement for the pending orders view so SQLite can reuse the prepared statement
+PREPARED_SELECT_PENDING = """
+    SELECT * FROM orders
+    WHERE status IN ('pending', 'processing')
+      AND (? IS NULL OR isRollover = ?)
+    ORDER BY timestamp DESC LIMIT ?
+"""
+
+# Execution details update_order_status can write, in SET clause order
+EXECUTION_FIELDS = ('ib_order_id', 'ib_status', 'filled', 'remaining', 'avg_fill_price', 'is_mock')
+
+def _build_status_update_sql(fields):
+    """
+    Precompute the UPDATE statement for every subset of execution fields
+    
+    Args:
+        fields (tuple): Optional column names, in SET clause order
+        
+    Returns:
+        dict: frozenset of present fields -> (sql, fields in parameter order)
+    """
+    statements = {}
+    for r in range(len(fields) + 1):
+        for subset in combinations(fields, r):
+            set_clause = ''.join(f", {field} = ?" for field in subset)
+            sql = f"UPDATE orders SET status = ?, executed = ?{set_clause} WHERE id = ?"
+            statements[frozenset(subset)] = (sql, subset)
+    return statements
+
+_STATUS_UPDATE_SQL = _build_status_update_sql(EXECUTION_FIELDS)
+
+# get_orders SQL keyed by filter shape, filled on first use of each shape
+_GET_ORDERS_SQL = {}
+
+# Stays under the 999 bound-parameter limit of older SQLite builds
+MAX_SQL_PARAMS = 900
+
 class OptionsDatabase:
     """
     Class for logging options recommendations to SQLite database
     """
+    # Orders are append-only (new ids every time), so a plain INSERT is used.
+    # The timestamp is generated by SQLite, in local time like existing rows
+    _ORDER_INSERT_SQL = '''
+        INSERT INTO orders 
+        (timestamp, ticker, option_type, action, strike, expiration, premium, quantity, 
+         bid, ask, last, delta, gamma, theta, vega, implied_volatility, 
+         open_interest, volume, is_mock,
+         earnings_max_contracts, earnings_premium_per_contract, 
+         earnings_total_premium, earnings_return_on_cash, 
+         earnings_return_on_capital, status, executed, isRollover)
+        VALUES (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'),
+                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    # Every column of the orders table; projections are checked against this
+    _ORDER_COLUMNS = frozenset((
+        'id', 'timestamp', 'ticker', 'option_type', 'action', 'strike', 'expiration',
+        'premium', 'quantity', 'status', 'executed', 'bid', 'ask', 'last',
+        'delta', 'gamma', 'theta', 'vega', 'implied_volatility',
+        'open_interest', 'volume', 'is_mock',
+        'earnings_max_contracts', 'earnings_premium_per_contract',
+        'earnings_total_premium', 'earnings_return_on_cash', 'earnings_return_on_capital',
+        'ib_order_id', 'ib_status', 'filled', 'remaining', 'avg_fill_price', 'isRollover'
+    ))
+    
     def __init__(self, db_name=None):
         """
         Initialize the options database
@@ -27,14 +91,69 @@ class OptionsDatabase:
             db_path = Path.cwd() / db_name
             
         self.db_path = db_path
+        # One long-lived connection per thread, closed at interpreter exit
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self._close_all)
         self._create_tables_if_not_exist()
         self._migrate_database()
+        self._create_indexes_if_not_exist()
+    
+    def _connect(self):
+        """
+        Open a connection to the database with per-connection PRAGMAs applied
+        
+        Returns:
+            sqlite3.Connection: Open database connection
+        """
+        # Autocommit mode: multi-statement writes open their own transaction with BEGIN
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # This enables column access by name
+        # Safe with WAL: only a power loss (not an app crash) can drop the last commits
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        # Pages are shared through the OS page cache via mmap; the private cache is kept
+        # (no cache=shared URI) since shared-cache mode brings back table-level locking
+        # that fails concurrent thread writers with SQLITE_LOCKED instead of waiting
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+    
+    def _conn(self):
+        """
+        Get the calling thread's cached connection, opening it on first use
+        
+        Returns:
+            sqlite3.Connection: Open database connection
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def _close_all(self):
+        """Close every cached connection"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local = threading.local()
     
     def _create_tables_if_not_exist(self):
         """Create necessary tables with flattened structure"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
+        # WAL is persistent on the database file, so it only needs to be set once
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Create recommendations table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS recommendations (
@@ -51,10 +170,13 @@ class OptionsDatabase:
         ''')
         
         # Create orders table with flattened structure 
+        # Kept as a rowid table: id aliases the rowid, so lookups by id are already a
+        # single B-tree search, and WITHOUT ROWID would lose AUTOINCREMENT and
+        # last_insert_rowid(), which save_orders relies on
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS orders (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
+                timestamp TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')),
                 ticker TEXT NOT NULL,
                 option_type TEXT NOT NULL,
                 action TEXT NOT NULL,
@@ -102,7 +224,6 @@ class OptionsDatabase:
         ''')
         
         conn.commit()
-        conn.close()
     
     def _migrate_database(self):
         """
@@ -112,7 +233,7 @@ class OptionsDatabase:
         and adds them if necessary.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
             # Get the current columns in the orders table
@@ -128,13 +249,16 @@ class OptionsDatabase:
                 
                 # Look for paired orders that might be rollover orders
                 # For simplicity, we'll identify orders created close in time with opposite actions
+                # Only the buy side of the time window goes through datetime(), so the
+                # sell side is an index range scan on (ticker, option_type, timestamp)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_ticker_type_ts ON orders(ticker, option_type, timestamp)")
                 cursor.execute("""
                     WITH order_pairs AS (
                         SELECT o1.id as buy_id, o2.id as sell_id
                         FROM orders o1
                         JOIN orders o2 ON o1.ticker = o2.ticker 
                                       AND o1.option_type = o2.option_type
-                                      AND datetime(o1.timestamp) BETWEEN datetime(o2.timestamp, '-2 minutes') AND datetime(o2.timestamp, '+2 minutes')
+                                      AND o2.timestamp BETWEEN datetime(o1.timestamp, '-2 minutes') AND datetime(o1.timestamp, '+2 minutes')
                                       AND o1.action = 'BUY' AND o2.action = 'SELL'
                                       AND o1.isRollover = 0 AND o2.isRollover = 0
                     )
@@ -146,30 +270,115 @@ class OptionsDatabase:
                 if potential_rollover_pairs:
                     print(f"Found {len(potential_rollover_pairs)} potential rollover order pairs")
                     
-                    for buy_id, sell_id in potential_rollover_pairs:
-                        # Update the buy order
-                        cursor.execute("""
-                            UPDATE orders
-                            SET isRollover = 1
-                            WHERE id = ?
-                        """, (buy_id,))
-                        
-                        # Update the sell order
-                        cursor.execute("""
-                            UPDATE orders
-                            SET isRollover = 1
-                            WHERE id = ?
-                        """, (sell_id,))
+                    # Both sides of every pair, deduplicated since one order can pair with several
+                    ids = list(dict.fromkeys(order_id for pair in potential_rollover_pairs for order_id in pair))
+                    
+                    cursor.execute("BEGIN")
+                    # Chunked to stay under SQLite's bound-parameter limit
+                    for start in range(0, len(ids), MAX_SQL_PARAMS):
+                        chunk = ids[start:start + MAX_SQL_PARAMS]
+                        cursor.execute(
+                            f"UPDATE orders SET isRollover = 1 WHERE id IN ({','.join('?' * len(chunk))})",
+                            chunk
+                        )
                     
-                    print(f"Migration: Marked {len(potential_rollover_pairs) * 2} orders as potential rollovers")
+                    print(f"Migration: Marked {len(ids)} orders as potential rollovers")
             
             conn.commit()
-            conn.close()
             print("Database migration completed successfully")
         except Exception as e:
+            # The connection is reused, so don't leave a half-applied transaction open
+            if self._conn().in_transaction:
+                self._conn().rollback()
             print(f"Error during database migration: {str(e)}")
             print(traceback.format_exc())
     
+    def _create_indexes_if_not_exist(self):
+        """
+        Create indexes for the order lookups
+        
+        Runs after the migrations, since older databases only get the
+        isRollover column from _migrate_database.
+        """
+        try:
+            conn = self._conn()
+            cursor = conn.cursor()
+            
+            # Status/ticker filters in get_orders, always ordered by newest first
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_status_ts ON orders(status, timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_ticker_ts ON orders(ticker, timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_rollover ON orders(isRollover, status)")
+            # Pending view; the predicate must match PREPARED_SELECT_PENDING exactly for
+            # SQLite to use this (small, since few orders are open at a time) partial index
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_pending ON orders(timestamp DESC) WHERE status IN ('pending', 'processing')")
+            # Self-join used by the rollover migration
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_ticker_type_ts ON orders(ticker, option_type, timestamp)")
+            
+            # Gather planner statistics until the orders table has some; an empty
+            # table leaves none, and without them the planner skips the partial index
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None or cursor.execute(
+                    "SELECT 1 FROM sqlite_stat1 WHERE tbl = 'orders' LIMIT 1").fetchone() is None:
+                cursor.execute("ANALYZE")
+        except Exception as e:
+            print(f"Error creating indexes: {str(e)}")
+    
+    def _to_row(self, order_data):
+        """
+        Build the INSERT parameter tuple for an order
+        
+        Args:
+            order_data (dict): Option order data
+            
+        Returns:
+            tuple: Parameters matching _ORDER_INSERT_SQL
+        """
+        # Extract data from order
+        ticker = order_data.get('ticker', '')
+        option_type = order_data.get('option_type', '')
+        action = order_data.get('action', 'SELL')  # Default action is sell for options
+        strike = order_data.get('strike', 0)
+        expiration = order_data.get('expiration', '')
+        premium = order_data.get('premium', 0)
+        quantity = order_data.get('quantity', 1)
+        
+        # Extract pricing data
+        bid = order_data.get('bid', 0)
+        ask = order_data.get('ask', 0)
+        last = order_data.get('last', 0)
+        
+        # Extract greeks
+        delta = order_data.get('delta', 0)
+        gamma = order_data.get('gamma', 0)
+        theta = order_data.get('theta', 0)
+        vega = order_data.get('vega', 0)
+        implied_volatility = order_data.get('implied_volatility', 0)
+        
+        # Extract market data
+        open_interest = order_data.get('open_interest', 0)
+        volume = order_data.get('volume', 0)
+        # Boolean columns are bound as plain 0/1 integers
+        is_mock = int(bool(order_data.get('is_mock', False)))
+        
+        # Extract earnings data
+        earnings_max_contracts = order_data.get('earnings_max_contracts', 0)
+        earnings_premium_per_contract = order_data.get('earnings_premium_per_contract', 0)
+        earnings_total_premium = order_data.get('earnings_total_premium', 0)
+        earnings_return_on_cash = order_data.get('earnings_return_on_cash', 0)
+        earnings_return_on_capital = order_data.get('earnings_return_on_capital', 0)
+        
+        # Extract rollover specific data
+        is_rollover = int(bool(order_data.get('isRollover', False)))
+        
+        return (
+            ticker, option_type, action, strike, expiration, premium, quantity, 
+            bid, ask, last, delta, gamma, theta, vega, implied_volatility, 
+            open_interest, volume, is_mock,
+            earnings_max_contracts, earnings_premium_per_contract, 
+            earnings_total_premium, earnings_return_on_cash, 
+            earnings_return_on_capital, 'pending', 0, is_rollover
+        )
+    
     def save_order(self, order_data):
         """
         Save an option order to the database using flattened structure
@@ -180,74 +389,36 @@ class OptionsDatabase:
         Returns:
             int: ID of the inserted record
         """
+        # A single order is just a batch of one
+        record_ids = self.save_orders([order_data])
+        return record_ids[0] if record_ids else None
+    
+    def save_orders(self, orders):
+        """
+        Save several option orders in a single transaction
+        
+        Args:
+            orders (list): List of option order data dictionaries
+            
+        Returns:
+            list: IDs of the inserted records (in input order), or None on failure
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            # Extract data from order
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ticker = order_data.get('ticker', '')
-            option_type = order_data.get('option_type', '')
-            action = order_data.get('action', 'SELL')  # Default action is sell for options
-            strike = order_data.get('strike', 0)
-            expiration = order_data.get('expiration', '')
-            premium = order_data.get('premium', 0)
-            quantity = order_data.get('quantity', 1)
-            
-            # Extract pricing data
-            bid = order_data.get('bid', 0)
-            ask = order_data.get('ask', 0)
-            last = order_data.get('last', 0)
-            
-            # Extract greeks
-            delta = order_data.get('delta', 0)
-            gamma = order_data.get('gamma', 0)
-            theta = order_data.get('theta', 0)
-            vega = order_data.get('vega', 0)
-            implied_volatility = order_data.get('implied_volatility', 0)
-            
-            # Extract market data
-            open_interest = order_data.get('open_interest', 0)
-            volume = order_data.get('volume', 0)
-            is_mock = order_data.get('is_mock', False)
-            
-            # Extract earnings data
-            earnings_max_contracts = order_data.get('earnings_max_contracts', 0)
-            earnings_premium_per_contract = order_data.get('earnings_premium_per_contract', 0)
-            earnings_total_premium = order_data.get('earnings_total_premium', 0)
-            earnings_return_on_cash = order_data.get('earnings_return_on_cash', 0)
-            earnings_return_on_capital = order_data.get('earnings_return_on_capital', 0)
-            
-            # Extract rollover specific data
-            is_rollover = order_data.get('isRollover', False)
-            
-            # Insert order with all fields using the flattened structure
-            cursor.execute('''
-                INSERT INTO orders 
-                (timestamp, ticker, option_type, action, strike, expiration, premium, quantity, 
-                 bid, ask, last, delta, gamma, theta, vega, implied_volatility, 
-                 open_interest, volume, is_mock,
-                 earnings_max_contracts, earnings_premium_per_contract, 
-                 earnings_total_premium, earnings_return_on_cash, 
-                 earnings_return_on_capital, status, executed, isRollover)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                timestamp, ticker, option_type, action, strike, expiration, premium, quantity, 
-                bid, ask, last, delta, gamma, theta, vega, implied_volatility, 
-                open_interest, volume, is_mock,
-                earnings_max_contracts, earnings_premium_per_contract, 
-                earnings_total_premium, earnings_return_on_cash, 
-                earnings_return_on_capital, 'pending', False, is_rollover
-            ))
-            
-            record_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            rows = [self._to_row(order_data) for order_data in orders]
+            conn = self._conn()
+            
+            # All inserts share one transaction; the with block commits it or rolls it back
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.executemany(self._ORDER_INSERT_SQL, rows)
+                
+                # The transaction holds the write lock, so AUTOINCREMENT ids are consecutive
+                last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
             
-            return record_id
+            return list(range(last_id - len(rows) + 1, last_id + 1))
         except Exception as e:
-            print(f"Error saving order: {str(e)}")
+            print(f"Error saving orders: {str(e)}")
             return None
-            
     
     def get_pending_orders(self, executed=False, limit=50, isRollover=None):
         """
@@ -259,14 +430,37 @@ class OptionsDatabase:
             isRollover (bool): Whether to filter for rollover orders
             
         Returns:
-            list: List of order dictionaries
+            list: List of sqlite3.Row objects
         """
         if executed:
             # Return executed orders (completed, cancelled, etc.)
             return self.get_orders(executed=executed, limit=limit, isRollover=isRollover)
-        else:
-            # Return pending/processing orders specifically
-            return self.get_orders(status_filter=['pending', 'processing'], limit=limit, isRollover=isRollover)
+        
+        # Return pending/processing orders specifically
+        try:
+            return self.select_pending_orders(limit=limit, isRollover=isRollover).fetchall()
+        except Exception as e:
+            print(f"Error getting pending orders: {str(e)}")
+            return []
+    
+    def select_pending_orders(self, limit=50, isRollover=None):
+        """
+        Run the pending/processing orders query without materializing the result set.
+        The query executes here, so errors surface to the caller rather than
+        while the rows are being consumed.
+        
+        Args:
+            limit (int): Maximum number of orders to return
+            isRollover (bool): Whether to filter for rollover orders
+            
+        Returns:
+            sqlite3.Cursor: Executed cursor yielding order rows, newest first
+        """
+        cursor = self._conn().cursor()
+        if isRollover is not None:
+            isRollover = int(bool(isRollover))
+        # Rows support access by column name and are serialized directly by the API
+        return cursor.execute(PREPARED_SELECT_PENDING, (isRollover, isRollover, limit))
     
     def update_order_status(self, order_id, status, executed=False, execution_details=None):
         """
@@ -282,46 +476,19 @@ class OptionsDatabase:
             bool: True if successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
-            # Start with basic update query
-            update_query = '''
-                UPDATE orders
-                SET status = ?, executed = ?
-                WHERE id = ?
-            '''
-            params = [status, executed]
-            
-            # If we have execution details, update those fields too
+            # Execution details columns present in this call (api field name == db column)
+            present = frozenset()
             if execution_details and isinstance(execution_details, dict):
-                set_clauses = []
-                
-                # Map execution details to database fields
-                field_mappings = {
-                    'ib_order_id': 'ib_order_id',
-                    'ib_status': 'ib_status',
-                    'filled': 'filled',
-                    'remaining': 'remaining',
-                    'avg_fill_price': 'avg_fill_price',
-                    'is_mock': 'is_mock'
-                }
-                
-                # Check for each field in the mapping
-                for api_field, db_field in field_mappings.items():
-                    if api_field in execution_details:
-                        set_clauses.append(f"{db_field} = ?")
-                        params.append(execution_details[api_field])
-                
-                params.append(order_id)
-                # If we have additional fields to set, add them to the query
-                if set_clauses:
-                    # Reconstruct the query with the additional fields
-                    update_query = '''
-                        UPDATE orders
-                        SET status = ?, executed = ?, {}
-                        WHERE id = ?
-                    '''.format(', '.join(set_clauses))
+                present = frozenset(field for field in EXECUTION_FIELDS if field in execution_details)
+            
+            # Same SQL text for the same set of fields, so the prepared statement is reused
+            update_query, fields = _STATUS_UPDATE_SQL[present]
+            params = [status, int(bool(executed))]
+            params.extend(execution_details[field] for field in fields)
+            params.append(order_id)
             
             # Execute the query
             cursor.execute(update_query, params)
@@ -331,13 +498,6 @@ class OptionsDatabase:
             
             conn.commit()
             
-            # Verify the update by reading the order back
-            verification_cursor = conn.cursor()
-            verification_cursor.execute("SELECT status, executed FROM orders WHERE id = ?", (order_id,))
-            verification_result = verification_cursor.fetchone()
-            
-            conn.close()
-            
             return affected_rows > 0
         except Exception as e:
             print(f"ERROR: Error updating order status: {str(e)}")
@@ -355,7 +515,7 @@ class OptionsDatabase:
             bool: True if successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -367,7 +527,6 @@ class OptionsDatabase:
             affected_rows = cursor.rowcount
             
             conn.commit()
-            conn.close()
             
             # Return True if at least one row was deleted
             return affected_rows > 0
@@ -387,47 +546,35 @@ class OptionsDatabase:
             bool: True if update was successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn()
             cursor = conn.cursor()
             
-            # Get current order to validate it exists and check its status
-            cursor.execute('''
-                SELECT status FROM orders
-                WHERE id = ?
-            ''', (order_id,))
-            
-            order = cursor.fetchone()
-            if not order:
-                print(f"No order found with ID {order_id}")
-                conn.close()
-                return False
-            
-            # Only update if the order is in 'pending' status
-            if order[0] != 'pending':
-                print(f"Cannot update quantity for order with status '{order[0]}'")
-                conn.close()
-                return False
-            
-            # Update the order quantity
+            # Only pending orders can change quantity; the status check is part of the UPDATE
             cursor.execute('''
                 UPDATE orders 
                 SET quantity = ?,
-                    timestamp = ?
-                WHERE id = ?
-            ''', (quantity, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), order_id))
-            
-            # Check if any rows were updated
-            affected_rows = cursor.rowcount
+                    timestamp = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+                WHERE id = ? AND status = 'pending'
+            ''', (quantity, order_id))
             
             conn.commit()
-            conn.close()
             
-            if affected_rows > 0:
+            if cursor.rowcount > 0:
                 print(f"Successfully updated quantity to {quantity} for order {order_id}")
                 return True
+            
+            # Nothing updated: look the order up only to explain why
+            cursor.execute('''
+                SELECT status FROM orders
+                WHERE id = ?
+            ''', (order_id,))
+            
+            order = cursor.fetchone()
+            if not order:
+                print(f"No order found with ID {order_id}")
             else:
-                print(f"No changes made to order {order_id}")
-                return False
+                print(f"Cannot update quantity for order with status '{order[0]}'")
+            return False
             
         except Exception as e:
             error_msg = f"Error updating order quantity: {str(e)}"
@@ -435,28 +582,44 @@ class OptionsDatabase:
             traceback.print_exc()
             return False
             
-    def get_order(self, order_id):
+    def _projection(self, columns):
+        """
+        Build the SELECT column list for an order query
+        
+        Args:
+            columns (list): Column names, or None for every column
+            
+        Returns:
+            str: Comma-separated column list, or '*'
+        """
+        if columns is None:
+            return '*'
+        unknown = set(columns) - self._ORDER_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown order columns: {', '.join(sorted(unknown))}")
+        return ', '.join(columns)
+    
+    def get_order(self, order_id, columns=None):
         """
         Get a specific order by ID
         
         Args:
             order_id (int): ID of the order to retrieve
+            columns (list): Columns to return (None = all columns)
             
         Returns:
             dict: Order data or None if not found
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # This enables column access by name
+            conn = self._conn()
             cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT * FROM orders
+            cursor.execute(f'''
+                SELECT {self._projection(columns)} FROM orders
                 WHERE id = ?
             ''', (order_id,))
             
             row = cursor.fetchone()
-            conn.close()
             
             if not row:
                 return None
@@ -469,7 +632,35 @@ class OptionsDatabase:
             print(f"Error getting order: {str(e)}")
             return None
             
-    def get_orders(self, status=None, executed=None, ticker=None, limit=50, status_filter=None, isRollover=None):
+    def _build_orders_query(self, columns, n_status, by_status, by_executed, by_ticker, by_rollover):
+        """
+        Build the get_orders SELECT for one combination of filters
+        
+        Args:
+            columns (tuple): Columns to return (None = all columns)
+            n_status (int): Number of values in the status IN (...) filter, 0 for none
+            by_status (bool): Filter by a single status
+            by_executed (bool): Filter by executed flag
+            by_ticker (bool): Filter by ticker symbol
+            by_rollover (bool): Filter by rollover flag
+            
+        Returns:
+            str: SQL with placeholders in get_orders parameter order
+        """
+        query = f"SELECT {self._projection(columns)} FROM orders WHERE 1=1"
+        if n_status:
+            query += f" AND status IN ({', '.join('?' * n_status)})"
+        elif by_status:
+            query += " AND status = ?"
+        if by_executed:
+            query += " AND executed = ?"
+        if by_ticker:
+            query += " AND ticker = ?"
+        if by_rollover:
+            query += " AND isRollover = ?"
+        return query + " ORDER BY timestamp DESC LIMIT ?"
+    
+    def get_orders(self, status=None, executed=None, ticker=None, limit=50, status_filter=None, isRollover=None, columns=None):
         """
         Get orders from the database with flexible filtering
         
@@ -480,56 +671,70 @@ class OptionsDatabase:
             limit (int): Maximum number of orders to return
             status_filter (list): Filter by multiple status values
             isRollover (bool): Filter by rollover flag (None = no filter)
+            columns (list): Columns to return (None = all columns)
             
         Returns:
-            list: List of order dictionaries
+            list: List of sqlite3.Row objects
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # This enables column access by name
+            conn = self._conn()
             cursor = conn.cursor()
             
-            # Build the query based on filters
-            query = "SELECT * FROM orders WHERE 1=1"
             params = []
             
             # Handle status filtering (single status or list of statuses)
+            n_status = 0
             if status_filter is not None and isinstance(status_filter, list) and status_filter:
-                placeholders = ', '.join(['?' for _ in status_filter])
-                query += f" AND status IN ({placeholders})"
+                n_status = len(status_filter)
                 params.extend(status_filter)
             elif status is not None:
-                query += " AND status = ?"
                 params.append(status)
                 
             if executed is not None:
-                query += " AND executed = ?"
-                params.append(executed)
+                params.append(int(bool(executed)))
                 
             if ticker is not None:
-                query += " AND ticker = ?"
                 params.append(ticker)
                 
             # Add rollover filter if specified
             if isRollover is not None:
-                query += " AND isRollover = ?"
-                params.append(isRollover)
+                params.append(int(bool(isRollover)))
                 
-            query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
             
-            cursor.execute(query, params)
+            # SQL text depends only on the shape of the filters, so it's built once per shape
+            shape = (tuple(columns) if columns is not None else None, n_status,
+                     n_status == 0 and status is not None, executed is not None,
+                     ticker is not None, isRollover is not None)
+            query = _GET_ORDERS_SQL.get(shape)
+            if query is None:
+                query = _GET_ORDERS_SQL[shape] = self._build_orders_query(*shape)
             
-            rows = cursor.fetchall()
-            conn.close()
+            cursor.execute(query, params)
             
-            # Convert rows to dictionaries
-            orders = []
-            for row in rows:
-                order = dict(row)
-                orders.append(order)
-                
-            return orders
+            # Rows support access by column name and are serialized directly by the API
+            return cursor.fetchall()
         except Exception as e:
             print(f"Error getting orders: {str(e)}")
-            return [] 
\ No newline at end of file
+            return [] 
+# One shared OptionsDatabase per path; each keeps a connection per thread
+_databases = {}
+_databases_lock = threading.Lock()
+
+def get_database(db_name=None):
+    """
+    Get the process-wide OptionsDatabase for a path, creating it on first use
+    
+    Args:
+        db_name (str, optional): Database file name, as for OptionsDatabase
+        
+    Returns:
+        OptionsDatabase: Shared database handle
+    """
+    db = _databases.get(db_name)
+    if db is None:
+        with _databases_lock:
+            db = _databases.get(db_name)
+            if db is None:
+                db = _databases[db_name] = OptionsDatabase(db_name)
+    return db
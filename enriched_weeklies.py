@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 # ================= CONFIGURATION =================
 CSV_URL = "https://www.cboe.com/available_weeklys/get_csv_download/"
 ARCHIVE_DIR = "weeklys_archive"
+# Read buffer for the downloaded CSV (the default 8KiB means many small reads)
+READ_BUFFER_SIZE = 1 << 16
 # Set to True if you want to wait for real IV (slower), 
 # or False to just use Beta (instant).
 FETCH_REAL_IV = True 
@@ -37,7 +39,7 @@ def parse_csv_to_data(filepath):
     """Returns a dictionary: {TICKER: NAME}"""
     data_map = {}
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+        with open(filepath, 'r', encoding='utf-8', errors='replace', buffering=READ_BUFFER_SIZE) as f:
             reader = csv.reader(f)
             for row in reader:
                 if len(row) < 2: continue
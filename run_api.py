@@ -8,9 +8,13 @@ Script to start the Auto-Trader API server using platform-appropriate WSGI serve
 import os
 import sys
 import platform
+import socket
+import pkgutil
+import hashlib
 import argparse
 import subprocess
 import importlib.util
+from pathlib import Path
 from dotenv import load_dotenv
 from core.logging_config import get_logger
 
@@ -20,11 +24,61 @@ load_dotenv()
 # Configure logging
 logger = get_logger('autotrader.server', 'server')
 
+# Touched after a successful dependency check; one per Python environment
+DEPS_MARKER = Path.home() / '.cache' / 'autotrader' / f"deps-{hashlib.md5(sys.prefix.encode()).hexdigest()[:12]}.ok"
+
+def _deps_marker_fresh(requirements_path):
+    """
+    Check whether dependencies were verified since requirements.txt last changed
+    
+    Args:
+        requirements_path (str): Path to requirements.txt
+        
+    Returns:
+        bool: True if the marker is at least as new as requirements.txt
+    """
+    try:
+        return DEPS_MARKER.stat().st_mtime >= os.path.getmtime(requirements_path)
+    except OSError:
+        return False
+
+def _touch_deps_marker():
+    """Record a successful dependency check"""
+    try:
+        DEPS_MARKER.parent.mkdir(parents=True, exist_ok=True)
+        DEPS_MARKER.touch()
+    except OSError as e:
+        logger.warning(f"Could not write dependency marker {DEPS_MARKER}: {str(e)}")
+
+def _port_in_use(port):
+    """
+    Check whether a port can be bound on all interfaces
+    
+    Args:
+        port (int): TCP port to test
+        
+    Returns:
+        bool: True if another process holds the port
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if os.name == 'nt':
+        # On Windows SO_REUSEADDR would let bind succeed over an active listener
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    else:
+        # SO_REUSEADDR so sockets lingering in TIME_WAIT don't count as in use
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind(('0.0.0.0', port))
+        return False
+    except OSError:
+        return True
+    finally:
+        sock.close()
+
 def check_and_install_dependencies():
     """
     Check for required dependencies and install them if needed
     """
-    logger.info("Checking dependencies...")
     try:
         # First, ensure pip is available
         import pip
@@ -45,10 +99,18 @@ def check_and_install_dependencies():
             logger.error(f"Could not find requirements.txt")
             return
     
+    # Nothing to do if the last check passed and requirements.txt hasn't changed
+    if _deps_marker_fresh(requirements_path):
+        logger.info("Dependencies already verified, skipping check")
+        return
+    
+    logger.info("Checking dependencies...")
+    
     # Read requirements
     try:
         with open(requirements_path, 'r') as f:
-            requirements = [line.strip() for line in f.readlines() 
+            lines = f.read().splitlines()
+        requirements = [line.strip() for line in lines
                         if line.strip() and not line.strip().startswith('#')]
     except Exception as e:
         logger.error(f"Error reading requirements.txt: {str(e)}")
@@ -56,11 +118,16 @@ def check_and_install_dependencies():
         
     # Install missing requirements
     missing_deps = []
+    deps_ok = True
+    # Top-level importable names, gathered in one pass over sys.path
+    installed = {module.name.lower() for module in pkgutil.iter_modules()} | set(sys.builtin_module_names)
     for req in requirements:
         # Extract package name (everything before any comparison operator)
         package_name = req.split('>=')[0].split('==')[0].split('>')[0].split('<')[0].split('<=')[0].strip()
+        module_name = package_name.replace('-', '_')
         
-        if not importlib.util.find_spec(package_name.replace('-', '_')):
+        # find_spec only for names the scan didn't list (e.g. namespace packages)
+        if module_name.lower() not in installed and not importlib.util.find_spec(module_name):
             missing_deps.append(req)
     
     if missing_deps:
@@ -70,6 +137,7 @@ def check_and_install_dependencies():
             subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing_deps)
             logger.info("Successfully installed all missing dependencies.")
         except subprocess.CalledProcessError as e:
+            deps_ok = False
             logger.error(f"Failed to install dependencies: {str(e)}")
             logger.error("Please manually install them with: pip install -r requirements.txt")
     else:
@@ -83,6 +151,7 @@ def check_and_install_dependencies():
             subprocess.check_call([sys.executable, "-m", "pip", "install", "waitress>=2.0.0"])
             logger.info("Successfully installed waitress.")
         except subprocess.CalledProcessError as e:
+            deps_ok = False
             logger.error(f"Failed to install waitress: {str(e)}")
             logger.error("Please manually install it with: pip install waitress>=2.0.0")
     elif not is_windows and importlib.util.find_spec("gunicorn") is None:
@@ -91,16 +160,22 @@ def check_and_install_dependencies():
             subprocess.check_call([sys.executable, "-m", "pip", "install", "gunicorn>=20.1.0"])
             logger.info("Successfully installed gunicorn.")
         except subprocess.CalledProcessError as e:
+            deps_ok = False
             logger.error(f"Failed to install gunicorn: {str(e)}")
             logger.error("Please manually install it with: pip install gunicorn>=20.1.0")
+    
+    if deps_ok:
+        _touch_deps_marker()
 
 def main():
     """
     Start the API server using appropriate WSGI server based on platform
     """
     try:
-        # Check and install required dependencies
-        check_and_install_dependencies()
+        # Check and install required dependencies (set AUTOTRADER_SKIP_DEP_CHECK=1 to skip,
+        # e.g. in production where the environment is built ahead of time)
+        if not os.environ.get('AUTOTRADER_SKIP_DEP_CHECK'):
+            check_and_install_dependencies()
         
         # Parse command line arguments
         parser = argparse.ArgumentParser(description='Start the Auto-Trader API server')
@@ -121,12 +196,7 @@ def main():
         workers = os.environ.get('WORKERS', '4')
         
         # Check if port is available
-        import socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('127.0.0.1', int(port)))
-        sock.close()
-        
-        if result == 0:
+        if _port_in_use(int(port)):
             logger.error(f"Port {port} is already in use. Please stop the existing process or use a different port.")
             logger.info(f"Try: PORT={int(port)+1} python3 run_api.py")
             sys.exit(1)
@@ -149,13 +219,19 @@ def main():
         else:
             # Unix/Linux/Mac: Use gunicorn
             logger.info(f"Starting Auto-Trader API server on port {port} with {workers} workers using gunicorn")
+            # Replace this process with gunicorn (no intermediate shell, no idle parent)
+            # No --preload: each worker imports the app itself, so no SQLite connection or
+            # SnapTrade HTTP pool is ever inherited across fork()
+            args = ["gunicorn", f"--workers={workers}", f"--bind=0.0.0.0:{port}", "app:app"]
+            # exec discards anything still buffered, so write it out first
+            for handler in logger.handlers:
+                handler.flush()
+            sys.stdout.flush()
+            sys.stderr.flush()
             try:
-                # Build the gunicorn command
-                cmd = f"gunicorn --workers={workers} --bind=0.0.0.0:{port} app:app"
-                # Run gunicorn
-                os.system(cmd)
-            except Exception as e:
-                logger.error(f"Error starting gunicorn: {str(e)}")
+                os.execvp(args[0], args)
+            except FileNotFoundError:
+                logger.error("gunicorn executable not found on PATH")
                 
                 # Fallback to Flask development server
                 logger.info("Falling back to Flask development server")